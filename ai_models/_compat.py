@@ -0,0 +1,11 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""Python version compatibility helpers shared by ai_models and the scripts."""
+
+import sys
+from typing import Any
+
+# Keyword arguments enabling dataclass(slots=True), which needs Python 3.10+;
+# empty on older interpreters so the dataclass falls back to a regular __dict__
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,53 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""YAML parsing shared by the model definition loaders."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Union
+
+import yaml
+
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def load_yaml(stream: IO[str]) -> Any:
+    """Parse a YAML document, like yaml.safe_load but with the C loader if available.
+
+    Args:
+        stream: Open text file or other readable stream
+
+    Returns:
+        Parsed document
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_definition(path: Union[str, Path]) -> Any:
+    """Parse a model definition file, reusing the result while the file is unchanged.
+
+    The registry, pricing service and capability validator all read the same
+    files, and reload them after clear_cache(); only the first read of each
+    file version is parsed. The result is shared, so callers must not modify it.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed document
+    """
+    stat = os.stat(path)
+    return _load_definition(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_definition(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a definition file; keyed on its mtime and size so edits are re-read."""
+    with open(path) as f:
+        return load_yaml(f)
@@ -13,11 +13,13 @@ Example:
     ...     process_image()
 """
 
+from collections.abc import Iterable
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar
 
-import yaml
+from ai_models._yaml_loader import load_definition
 
 
 class ModelCapability(str, Enum):
@@ -76,6 +78,7 @@ class CapabilityValidator:
     fast lookup for runtime capability checking.
     """
 
+    _definitions_dir: ClassVar[Path] = Path(__file__).parent / "definitions"
     _capabilities_cache: ClassVar[dict[str, set[ModelCapability]]] = {}
     _loaded: ClassVar[bool] = False
 
@@ -85,14 +88,12 @@ class CapabilityValidator:
         if cls._loaded:
             return
 
-        definitions_dir = Path(__file__).parent / "definitions"
-        if not definitions_dir.exists():
+        if not cls._definitions_dir.exists():
             return
 
-        for yaml_file in definitions_dir.rglob("*.yaml"):
+        for yaml_file in cls._definitions_dir.rglob("*.yaml"):
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                data = load_definition(yaml_file)
 
                 if not data or "model_id" not in data:
                     continue
@@ -131,8 +132,21 @@ class CapabilityValidator:
             >>> ModelCapability.VISION in caps
             True
         """
+        return set(cls._lookup(model_id))
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _lookup(cls, model_id: str) -> frozenset[ModelCapability]:
+        """Return the memoized, immutable capability set for a model.
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            Frozen set of ModelCapability enums (empty if unknown)
+        """
         cls._load_capabilities()
-        return cls._capabilities_cache.get(model_id, set()).copy()
+        return frozenset(cls._capabilities_cache.get(model_id, ()))
 
     @classmethod
     def has_capability(cls, model_id: str, capability: ModelCapability) -> bool:
@@ -152,16 +166,15 @@ class CapabilityValidator:
             ... )
             True
         """
-        caps = cls.get_capabilities(model_id)
-        return capability in caps
+        return capability in cls._lookup(model_id)
 
     @classmethod
-    def has_all_capabilities(cls, model_id: str, capabilities: list[ModelCapability]) -> bool:
+    def has_all_capabilities(cls, model_id: str, capabilities: Iterable[ModelCapability]) -> bool:
         """Check if model has all specified capabilities.
 
         Args:
             model_id: Model identifier
-            capabilities: List of required capabilities
+            capabilities: Required capabilities
 
         Returns:
             True if model has all capabilities
@@ -173,16 +186,15 @@ class CapabilityValidator:
             ... )
             True
         """
-        model_caps = cls.get_capabilities(model_id)
-        return all(cap in model_caps for cap in capabilities)
+        return cls._lookup(model_id).issuperset(capabilities)
 
     @classmethod
-    def has_any_capability(cls, model_id: str, capabilities: list[ModelCapability]) -> bool:
+    def has_any_capability(cls, model_id: str, capabilities: Iterable[ModelCapability]) -> bool:
         """Check if model has any of the specified capabilities.
 
         Args:
             model_id: Model identifier
-            capabilities: List of capabilities to check
+            capabilities: Capabilities to check
 
         Returns:
             True if model has at least one capability
@@ -194,8 +206,7 @@ class CapabilityValidator:
             ... )
             True  # Has vision but not function calling
         """
-        model_caps = cls.get_capabilities(model_id)
-        return any(cap in model_caps for cap in capabilities)
+        return not cls._lookup(model_id).isdisjoint(capabilities)
 
     @classmethod
     def filter_models_by_capability(cls, capability: ModelCapability) -> list[str]:
@@ -242,6 +253,7 @@ class CapabilityValidator:
         """Clear cached capabilities and force reload."""
         cls._capabilities_cache.clear()
         cls._loaded = False
+        cls._lookup.cache_clear()
 
 
 # Convenience functions
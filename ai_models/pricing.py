@@ -16,15 +16,17 @@ Example:
     Cost: $0.0105
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
+from ai_models._compat import DATACLASS_SLOTS
+from ai_models._yaml_loader import load_definition
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Pricing:
     """Pricing information for a specific model at a point in time.
 
@@ -146,8 +148,7 @@ class PricingService:
                 continue
 
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                data = load_definition(yaml_file)
 
                 if not data or "model_id" not in data:
                     continue
@@ -238,6 +239,45 @@ class PricingService:
 
         return pricing.calculate_cost(input_tokens, output_tokens, cached_input_tokens)
 
+    def calculate_costs(
+        self,
+        model_ids: Optional[Iterable[str]],
+        input_tokens: int,
+        output_tokens: int,
+        cached_input_tokens: int = 0,
+    ) -> dict[str, float]:
+        """Calculate the cost of the same token usage on several models.
+
+        Args:
+            model_ids: Model identifiers, or None for every model with pricing
+            input_tokens: Number of input tokens
+            output_tokens: Number of output tokens
+            cached_input_tokens: Number of cached input tokens
+
+        Returns:
+            Dictionary mapping model_id to cost in USD
+
+        Raises:
+            ValueError: If a model is not found
+
+        Example:
+            >>> service = PricingService()
+            >>> costs = service.calculate_costs(None, input_tokens=1000, output_tokens=500)
+            >>> cheapest = min(costs, key=costs.get)
+        """
+        if model_ids is None:
+            model_ids = self._pricing_cache
+
+        costs = {}
+        for model_id in model_ids:
+            pricing = self._pricing_cache.get(model_id)
+            if pricing is None:
+                raise ValueError(f"Pricing not found for model: {model_id}")
+            costs[model_id] = pricing.calculate_cost(
+                input_tokens, output_tokens, cached_input_tokens
+            )
+        return costs
+
     def get_all_pricing(self) -> dict[str, Pricing]:
         """Get pricing for all models.
 
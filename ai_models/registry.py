@@ -19,19 +19,21 @@ Example:
     ...     process_image()
 """
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
 from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar, Optional, Union
 
-import yaml
-
+from ai_models._compat import DATACLASS_SLOTS
+from ai_models._yaml_loader import load_definition
 from ai_models.capabilities import CapabilityValidator, ModelCapability  # noqa: F401
 from ai_models.pricing import Pricing, PricingService  # noqa: F401
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ModelOptimization:
     """Optimization guidance for a model."""
 
@@ -39,9 +41,15 @@ class ModelOptimization:
     best_practices: list[str] = field(default_factory=list)
     cost_tier: str = "mid-tier"  # budget, mid-tier, premium
     speed_tier: str = "balanced"  # fast, balanced, thorough
+    # recommended_for lowercased once, for case-insensitive matching
+    recommended_for_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the lowercased recommendations."""
+        self.recommended_for_lower = frozenset(rec.lower() for rec in self.recommended_for)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ModelMetadata:
     """Metadata about a model."""
 
@@ -53,7 +61,7 @@ class ModelMetadata:
     docs_url: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Model:
     """Complete model specification.
 
@@ -89,10 +97,10 @@ class Model:
             capability = ModelCapability.from_string(capability)
         return capability in self.capabilities
 
-    def has_all_capabilities(self, capabilities: list[Union[ModelCapability, str]]) -> bool:
+    def has_all_capabilities(self, capabilities: Iterable[Union[ModelCapability, str]]) -> bool:
         """Check if model has all specified capabilities."""
         caps = [ModelCapability.from_string(c) if isinstance(c, str) else c for c in capabilities]
-        return all(cap in self.capabilities for cap in caps)
+        return self.capabilities.issuperset(caps)
 
     def calculate_cost(
         self,
@@ -148,6 +156,13 @@ class ModelRegistry:
 
     _models: ClassVar[dict[str, Model]] = {}
     _loaded: ClassVar[bool] = False
+    # Lowercased provider -> its models sorted by release date, with the dates
+    # alongside so availability queries can bisect
+    _by_provider: ClassVar[dict[str, list[Model]]] = {}
+    _release_dates: ClassVar[dict[str, list[date]]] = {}
+    # Capability / cost tier -> models having it, in load order
+    _by_capability: ClassVar[dict[ModelCapability, list[Model]]] = {}
+    _by_cost_tier: ClassVar[dict[str, list[Model]]] = {}
 
     @classmethod
     def _load_models(cls) -> None:
@@ -162,8 +177,7 @@ class ModelRegistry:
 
         for yaml_file in definitions_dir.rglob("*.yaml"):
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                data = load_definition(yaml_file)
 
                 if not data or "model_id" not in data:
                     continue
@@ -203,8 +217,8 @@ class ModelRegistry:
                 # Parse optimization
                 opt_data = data.get("optimization", {})
                 optimization = ModelOptimization(
-                    recommended_for=opt_data.get("recommended_for", []),
-                    best_practices=opt_data.get("best_practices", []),
+                    recommended_for=list(opt_data.get("recommended_for", [])),
+                    best_practices=list(opt_data.get("best_practices", [])),
                     cost_tier=opt_data.get("cost_tier", "mid-tier"),
                     speed_tier=opt_data.get("speed_tier", "balanced"),
                 )
@@ -227,8 +241,34 @@ class ModelRegistry:
             except Exception as e:
                 print(f"Warning: Failed to load model from {yaml_file}: {e}")
 
+        cls._build_indexes()
         cls._loaded = True
 
+    @classmethod
+    def _build_indexes(cls) -> None:
+        """Group loaded models by provider, capability and cost tier.
+
+        Provider groups are sorted by release date; the others keep load order.
+        """
+        by_provider: dict[str, list[Model]] = {}
+        by_capability: dict[ModelCapability, list[Model]] = {}
+        by_cost_tier: dict[str, list[Model]] = {}
+        for model in cls._models.values():
+            by_provider.setdefault(model.provider.lower(), []).append(model)
+            by_cost_tier.setdefault(model.optimization.cost_tier, []).append(model)
+            for capability in model.capabilities:
+                by_capability.setdefault(capability, []).append(model)
+        for models in by_provider.values():
+            # Stable, so models released on the same day keep their load order
+            models.sort(key=lambda m: m.metadata.release_date)
+        cls._by_provider = by_provider
+        cls._release_dates = {
+            provider: [m.metadata.release_date for m in models]
+            for provider, models in by_provider.items()
+        }
+        cls._by_capability = by_capability
+        cls._by_cost_tier = by_cost_tier
+
     @classmethod
     def _parse_date(cls, date_str: Optional[str]) -> date:
         """Parse ISO date string."""
@@ -283,7 +323,7 @@ class ModelRegistry:
             provider: Provider name ("anthropic", "openai", "google")
 
         Returns:
-            List of Model objects
+            List of Model objects, oldest release first
 
         Example:
             >>> models = ModelRegistry.get_by_provider("anthropic")
@@ -291,9 +331,22 @@ class ModelRegistry:
             3
         """
         cls._load_models()
-        return [
-            model for model in cls._models.values() if model.provider.lower() == provider.lower()
-        ]
+        return list(cls._by_provider.get(provider.lower(), []))
+
+    @classmethod
+    def group_by_provider(cls) -> dict[str, list[Model]]:
+        """Get all models grouped by provider.
+
+        Returns:
+            Dictionary mapping lowercased provider name to its models, oldest release first
+
+        Example:
+            >>> groups = ModelRegistry.group_by_provider()
+            >>> sorted(groups)
+            ['anthropic', 'google', 'openai']
+        """
+        cls._load_models()
+        return {provider: list(models) for provider, models in cls._by_provider.items()}
 
     @classmethod
     def filter_by_capability(cls, capability: Union[ModelCapability, str]) -> list[Model]:
@@ -314,7 +367,7 @@ class ModelRegistry:
         if isinstance(capability, str):
             capability = ModelCapability.from_string(capability)
 
-        return [model for model in cls._models.values() if capability in model.capabilities]
+        return list(cls._by_capability.get(capability, []))
 
     @classmethod
     def filter_by_cost_tier(cls, tier: str) -> list[Model]:
@@ -332,7 +385,7 @@ class ModelRegistry:
             True
         """
         cls._load_models()
-        return [model for model in cls._models.values() if model.optimization.cost_tier == tier]
+        return list(cls._by_cost_tier.get(tier, []))
 
     @classmethod
     def get_available_models(cls, as_of_date: Optional[date] = None) -> list[Model]:
@@ -371,14 +424,16 @@ class ModelRegistry:
             as_of_date: Date to check availability against (defaults to today)
 
         Returns:
-            List of available Model objects from the provider
+            List of available Model objects from the provider, oldest release first
 
         Example:
             >>> # Get OpenAI models available today
             >>> openai_models = ModelRegistry.get_available_by_provider("openai")
         """
-        available = cls.get_available_models(as_of_date)
-        return [m for m in available if m.provider.lower() == provider.lower()]
+        cls._load_models()
+        provider = provider.lower()
+        released = bisect_right(cls._release_dates.get(provider, []), as_of_date or date.today())
+        return cls._by_provider.get(provider, [])[:released]
 
     @classmethod
     def get_latest_model(cls, provider: str, as_of_date: Optional[date] = None) -> Optional[Model]:
@@ -397,16 +452,24 @@ class ModelRegistry:
             >>> print(latest.model_id)
             gpt-5
         """
-        models = cls.get_available_by_provider(provider, as_of_date)
-        if not models:
+        cls._load_models()
+        provider = provider.lower()
+        dates = cls._release_dates.get(provider, [])
+        released = bisect_right(dates, as_of_date or date.today())
+        if not released:
             return None
-        return max(models, key=lambda m: m.metadata.release_date)
+        # The first model released on the latest date, as max() over load order would pick
+        return cls._by_provider[provider][bisect_left(dates, dates[released - 1])]
 
     @classmethod
     def clear_cache(cls) -> None:
         """Clear all caches and force reload."""
         cls.get.cache_clear()
         cls._models.clear()
+        cls._by_provider = {}
+        cls._release_dates = {}
+        cls._by_capability = {}
+        cls._by_cost_tier = {}
         cls._loaded = False
 
 
@@ -0,0 +1,15 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""Compiled regex patterns shared by the prompt restructuring scripts."""
+
+import re
+
+# Markdown document title ("# Title")
+TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+
+# Repeated "**Complexity**:" metadata lines inside a prompt body
+COMPLEXITY_RE = re.compile(r"\n\*\*Complexity\*\*:.*?\n")
+
+# Claude's XML-formatted prompt inside the Model-Specific Optimizations section
+XML_BLOCK_RE = re.compile(r"```xml\n(.*?)```", re.DOTALL)
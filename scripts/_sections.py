@@ -0,0 +1,72 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""Markdown section scanning shared by the prompt restructuring scripts."""
+
+from typing import Dict, Tuple
+
+
+def find_line_start(content: str, prefix: str, pos: int = 0) -> int:
+    """
+    Return the offset of the first line at or after `pos` that begins with `prefix`.
+
+    `pos` must itself be the start of a line. Returns -1 if no line matches.
+    """
+    if content.startswith(prefix, pos):
+        return pos
+    index = content.find("\n" + prefix, pos)
+    return -1 if index == -1 else index + 1
+
+
+def _next_fence(content: str, pos: int) -> int:
+    """Return the start of the next line at or after `pos` opening or closing a code block."""
+    index = content.find("```", pos)
+    while index != -1:
+        line_start = content.rfind("\n", pos, index) + 1 or pos
+        if not content[line_start:index].strip():
+            return line_start
+        index = content.find("```", index + 3)
+    return -1
+
+
+def find_section_ranges(content: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Find character ranges for each major section.
+
+    Returns dict mapping section name to (start, end) offsets into `content`,
+    where start is the beginning of the section's ## header line.
+    Ignores ## headers that appear inside code blocks (``` ... ```).
+    """
+    sections = {}
+    current_section = None
+    start = 0
+    in_code_block = False
+    fence = _next_fence(content, 0)
+    header = find_line_start(content, "## ")
+
+    while header != -1:
+        # Track code block state up to this header
+        while fence != -1 and fence < header:
+            in_code_block = not in_code_block
+            fence_end = content.find("\n", fence)
+            fence = -1 if fence_end == -1 else _next_fence(content, fence_end + 1)
+
+        header_end = content.find("\n", header)
+        line_end = len(content) if header_end == -1 else header_end
+
+        # Match ## headers (but only outside code blocks)
+        if not in_code_block:
+            if current_section:
+                sections[current_section] = (start, header)
+            current_section = content[header:line_end].strip("# \n")
+            start = header
+
+        if header_end == -1:
+            break
+        header = find_line_start(content, "## ", header_end + 1)
+
+    # Add last section
+    if current_section:
+        sections[current_section] = (start, len(content))
+
+    return sections
@@ -5,7 +5,7 @@
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 from scripts.model_updater.fetchers.base_fetcher import ModelData
 
@@ -24,6 +24,24 @@ class ModelChange:
     description: str = ""
 
 
+class ChangeCounts(NamedTuple):
+    """Per-category change counts for a ChangeReport."""
+
+    new: int
+    removed: int
+    pricing: int
+    capability: int
+    metadata: int
+    context: int
+
+    @property
+    def total(self) -> int:
+        """Total number of changes across all categories."""
+        return (
+            self.new + self.removed + self.pricing + self.capability + self.metadata + self.context
+        )
+
+
 @dataclass
 class ChangeReport:
     """Report of all detected changes."""
@@ -47,17 +65,25 @@ class ChangeReport:
             or self.context_changes
         )
 
+    @property
+    def counts(self) -> ChangeCounts:
+        """Snapshot of per-category change counts.
+
+        Callers that need several counts should read this once and reuse it.
+        """
+        return ChangeCounts(
+            new=len(self.new_models),
+            removed=len(self.removed_models),
+            pricing=len(self.pricing_changes),
+            capability=len(self.capability_changes),
+            metadata=len(self.metadata_changes),
+            context=len(self.context_changes),
+        )
+
     @property
     def total_changes(self) -> int:
         """Total number of changes."""
-        return (
-            len(self.new_models)
-            + len(self.removed_models)
-            + len(self.pricing_changes)
-            + len(self.capability_changes)
-            + len(self.metadata_changes)
-            + len(self.context_changes)
-        )
+        return self.counts.total
 
     def to_markdown(self) -> str:
         """Generate markdown changelog.
@@ -99,22 +99,11 @@ class ModelUpdater:
 
             # Step 2: Validate fetched models
             logger.info("Step 2: Validating fetched models")
-            validation_results = self.validator.validate_batch(fetched_models)
-
-            # Check for validation failures
-            invalid_models = [
-                model_id for model_id, result in validation_results.items() if not result.is_valid
-            ]
-            if invalid_models:
-                logger.error(
-                    f"Validation failed for {len(invalid_models)} models: {invalid_models}"
-                )
-                # Continue with valid models only
-                fetched_models = [
-                    m for m in fetched_models if validation_results[m.model_id].is_valid
-                ]
-
-            summary = self.validator.get_validation_summary(validation_results)
+            validation_results, summary = self.validator.validate_batch_with_summary(fetched_models)
+
+            # Continue with valid models only; the validator already logged the failures
+            fetched_models = [m for m in fetched_models if validation_results[m.model_id].is_valid]
+
             logger.info(f"Validation summary: {summary}")
 
             # Step 3: Load current models
@@ -177,6 +166,9 @@ class ModelUpdater:
             logger.error(f"Model update failed: {e}", exc_info=True)
             return False
 
+        finally:
+            self.pr_creator.close()
+
     def _fetch_all_models(self) -> list[ModelData]:
         """Fetch models from all providers.
 
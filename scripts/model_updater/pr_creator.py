@@ -3,15 +3,25 @@
 
 """GitHub Pull Request creation automation."""
 
+import http.client
+import json
 import logging
+import os
+import re
+import shutil
 import subprocess
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from scripts.model_updater.change_detector import ChangeReport
+from scripts.model_updater.change_detector import ChangeCounts, ChangeReport
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_HOST = "api.github.com"
+
+# owner/repo from https://github.com/owner/repo(.git) or git@github.com:owner/repo(.git)
+_GITHUB_REMOTE = re.compile(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$")
+
 
 class PRCreator:
     """Creates GitHub pull requests for model updates."""
@@ -25,6 +35,126 @@ class PRCreator:
         self.repo_path = repo_path
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # GitHub REST/GraphQL access over one keep-alive HTTPS connection.
+        # Falls back to the gh CLI when no token or GitHub remote is available.
+        self._token: Optional[str] = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
+        self._token_resolved = bool(self._token)
+        self._repo_slug: Optional[str] = None
+        self._default_branch: Optional[str] = None
+        self._connection: Optional[http.client.HTTPSConnection] = None
+        self._gh_path: Optional[str] = None
+        self._pr_node_ids: dict[str, str] = {}
+
+    def close(self) -> None:
+        """Close the GitHub API connection, if one was opened."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _use_api(self) -> bool:
+        """Check whether GitHub can be reached via the REST API instead of gh."""
+        return bool(self._get_token()) and self._get_repo_slug() is not None
+
+    def _get_token(self) -> Optional[str]:
+        """Resolve a GitHub token, asking gh for its stored credentials at most once.
+
+        A single ``gh auth token`` call lets every later operation go through the
+        shared API connection instead of forking gh per operation.
+        """
+        if not self._token_resolved:
+            self._token_resolved = True
+            try:
+                result = subprocess.run(
+                    [self._gh(), "auth", "token"],
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    check=False,
+                )
+                if result.returncode == 0:
+                    self._token = result.stdout.decode("utf-8").strip() or None
+            except OSError:
+                self._token = None
+        return self._token
+
+    def _get_repo_slug(self) -> Optional[str]:
+        """Resolve owner/repo once, from GITHUB_REPOSITORY or the origin remote."""
+        if self._repo_slug is None:
+            slug = os.getenv("GITHUB_REPOSITORY")
+            if not slug:
+                result = subprocess.run(
+                    ["git", "config", "--get", "remote.origin.url"],
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    check=False,
+                )
+                match = _GITHUB_REMOTE.search(result.stdout.decode("utf-8").strip())
+                slug = match.group(1) if match else ""
+            self._repo_slug = slug
+        return self._repo_slug or None
+
+    def _github_request(
+        self, method: str, path: str, payload: Optional[dict[str, Any]] = None
+    ) -> Any:
+        """Send a request to the GitHub API and return the decoded JSON response.
+
+        Args:
+            method: HTTP method
+            path: API path, e.g. /repos/{owner}/{repo}/pulls
+            payload: Optional JSON body
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            RuntimeError: If GitHub responds with an error status
+        """
+        if self._connection is None:
+            self._connection = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=30)
+
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self._token}",
+            "User-Agent": "pm-prompt-toolkit-model-updater",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        try:
+            self._connection.request(method, path, body=body, headers=headers)
+            response = self._connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            # Drop the broken connection so the next call reconnects
+            self.close()
+            raise
+
+        if response.status >= 400:
+            raise RuntimeError(
+                f"GitHub API {method} {path} failed ({response.status}): "
+                f"{data.decode('utf-8', errors='replace')}"
+            )
+
+        decoded = json.loads(data) if data else {}
+        if isinstance(decoded, dict) and decoded.get("errors"):
+            raise RuntimeError(f"GitHub API {method} {path} failed: {decoded['errors']}")
+        return decoded
+
+    def _get_default_branch(self) -> str:
+        """Look up the repository's default branch once."""
+        if self._default_branch is None:
+            repo = self._github_request("GET", f"/repos/{self._get_repo_slug()}")
+            self._default_branch = repo["default_branch"]
+        return self._default_branch
+
+    def _gh(self) -> str:
+        """Resolve the gh executable once."""
+        if self._gh_path is None:
+            self._gh_path = shutil.which("gh") or "gh"
+        return self._gh_path
+
     def create_pr(
         self,
         changelog: ChangeReport,
@@ -48,12 +178,15 @@ class PRCreator:
             timestamp = datetime.now().strftime("%Y%m%d")
             branch_name = f"auto-update-models-{timestamp}"
 
+        # Count changes once; shared by the commit message, PR title and body
+        counts = changelog.counts
+
         try:
             # Create and checkout branch
             self._create_branch(branch_name)
 
             # Generate commit message
-            commit_msg = self._generate_commit_message(changelog)
+            commit_msg = self._generate_commit_message(changelog, counts)
 
             # Commit changes
             self._commit_changes(commit_msg)
@@ -62,7 +195,7 @@ class PRCreator:
             self._push_branch(branch_name)
 
             # Create PR
-            pr_url = self._create_github_pr(branch_name, changelog)
+            pr_url = self._create_github_pr(branch_name, changelog, counts)
 
             return pr_url
 
@@ -82,8 +215,9 @@ class PRCreator:
         result = subprocess.run(
             ["git", "rev-parse", "--verify", branch_name],
             cwd=self.repo_path,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
         )
 
         if result.returncode == 0:
@@ -137,12 +271,18 @@ class PRCreator:
             check=True,
         )
 
-    def _create_github_pr(self, branch_name: str, changelog: ChangeReport) -> str:
-        """Create GitHub PR using gh CLI.
+    def _create_github_pr(
+        self,
+        branch_name: str,
+        changelog: ChangeReport,
+        counts: Optional[ChangeCounts] = None,
+    ) -> str:
+        """Create GitHub PR via the GitHub API (or gh CLI as a fallback).
 
         Args:
             branch_name: Branch name
             changelog: ChangeReport with changes
+            counts: Precomputed change counts (computed from changelog if omitted)
 
         Returns:
             PR URL
@@ -150,46 +290,67 @@ class PRCreator:
         self.logger.info("Creating GitHub PR")
 
         # Generate PR title and body
-        title = self._generate_pr_title(changelog)
-        body = self._generate_pr_body(changelog)
+        if counts is None:
+            counts = changelog.counts
+        title = self._generate_pr_title(changelog, counts)
+        body = self._generate_pr_body(changelog, counts)
+
+        if self._use_api():
+            pr = self._github_request(
+                "POST",
+                f"/repos/{self._get_repo_slug()}/pulls",
+                {
+                    "title": title,
+                    "body": body,
+                    "head": branch_name,
+                    "base": self._get_default_branch(),
+                },
+            )
+            pr_url: str = pr["html_url"]
+            self._pr_node_ids[pr_url] = pr["node_id"]
+        else:
+            # Create PR using gh CLI
+            result = subprocess.run(
+                [
+                    self._gh(),
+                    "pr",
+                    "create",
+                    "--title",
+                    title,
+                    "--body",
+                    body,
+                    "--head",
+                    branch_name,
+                ],
+                cwd=self.repo_path,
+                capture_output=True,
+                check=True,
+            )
 
-        # Create PR using gh CLI
-        result = subprocess.run(
-            [
-                "gh",
-                "pr",
-                "create",
-                "--title",
-                title,
-                "--body",
-                body,
-                "--head",
-                branch_name,
-            ],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+            # Extract PR URL from output
+            pr_url = result.stdout.decode("utf-8").strip()
 
-        # Extract PR URL from output
-        pr_url = result.stdout.strip()
         self.logger.info(f"Created PR: {pr_url}")
 
         return pr_url
 
-    def _generate_pr_title(self, changelog: ChangeReport) -> str:
+    def _generate_pr_title(
+        self, changelog: ChangeReport, counts: Optional[ChangeCounts] = None
+    ) -> str:
         """Generate PR title.
 
         Args:
             changelog: ChangeReport with changes
+            counts: Precomputed change counts (computed from changelog if omitted)
 
         Returns:
             PR title
         """
-        total = changelog.total_changes
-        new_count = len(changelog.new_models)
-        pricing_count = len(changelog.pricing_changes)
+        if counts is None:
+            counts = changelog.counts
+        total = counts.total
+        new_count = counts.new
+        pricing_count = counts.pricing
 
         parts = []
         if new_count:
@@ -203,28 +364,33 @@ class PRCreator:
         else:
             return f"🤖 Auto-update models ({total} changes)"
 
-    def _generate_pr_body(self, changelog: ChangeReport) -> str:
+    def _generate_pr_body(
+        self, changelog: ChangeReport, counts: Optional[ChangeCounts] = None
+    ) -> str:
         """Generate PR body with changelog.
 
         Args:
             changelog: ChangeReport with changes
+            counts: Precomputed change counts (computed from changelog if omitted)
 
         Returns:
             PR body markdown
         """
+        if counts is None:
+            counts = changelog.counts
         body_parts = [
             "## 🤖 Automated Model Update",
             "",
-            f"**Changes detected:** {changelog.total_changes} total",
-            f"- 🆕 New models: {len(changelog.new_models)}",
-            f"- 💰 Pricing changes: {len(changelog.pricing_changes)}",
-            f"- ⚡ Capability changes: {len(changelog.capability_changes)}",
-            f"- 📏 Context changes: {len(changelog.context_changes)}",
-            f"- 📝 Metadata changes: {len(changelog.metadata_changes)}",
+            f"**Changes detected:** {counts.total} total",
+            f"- 🆕 New models: {counts.new}",
+            f"- 💰 Pricing changes: {counts.pricing}",
+            f"- ⚡ Capability changes: {counts.capability}",
+            f"- 📏 Context changes: {counts.context}",
+            f"- 📝 Metadata changes: {counts.metadata}",
         ]
 
-        if changelog.removed_models:
-            body_parts.append(f"- ⚠️ Deprecated models: {len(changelog.removed_models)}")
+        if counts.removed:
+            body_parts.append(f"- ⚠️ Deprecated models: {counts.removed}")
 
         body_parts.extend(
             [
@@ -255,23 +421,28 @@ class PRCreator:
 
         return "\n".join(body_parts)
 
-    def _generate_commit_message(self, changelog: ChangeReport) -> str:
+    def _generate_commit_message(
+        self, changelog: ChangeReport, counts: Optional[ChangeCounts] = None
+    ) -> str:
         """Generate commit message.
 
         Args:
             changelog: ChangeReport with changes
+            counts: Precomputed change counts (computed from changelog if omitted)
 
         Returns:
             Commit message
         """
+        if counts is None:
+            counts = changelog.counts
         summary_parts = []
 
-        if changelog.new_models:
-            summary_parts.append(f"{len(changelog.new_models)} new")
-        if changelog.pricing_changes:
-            summary_parts.append(f"{len(changelog.pricing_changes)} pricing")
-        if changelog.capability_changes:
-            summary_parts.append(f"{len(changelog.capability_changes)} capability")
+        if counts.new:
+            summary_parts.append(f"{counts.new} new")
+        if counts.pricing:
+            summary_parts.append(f"{counts.pricing} pricing")
+        if counts.capability:
+            summary_parts.append(f"{counts.capability} capability")
 
         if summary_parts:
             summary = f"feat: Auto-update models ({', '.join(summary_parts)} changes)"
@@ -286,22 +457,22 @@ class PRCreator:
         ]
 
         # Add details
-        if changelog.new_models:
-            body_parts.append(f"New models ({len(changelog.new_models)}):")
+        if counts.new:
+            body_parts.append(f"New models ({counts.new}):")
             for model in changelog.new_models:
                 body_parts.append(f"- {model.name} ({model.model_id})")
             body_parts.append("")
 
-        if changelog.pricing_changes:
-            body_parts.append(f"Pricing changes ({len(changelog.pricing_changes)}):")
+        if counts.pricing:
+            body_parts.append(f"Pricing changes ({counts.pricing}):")
             for change in changelog.pricing_changes[:5]:  # Limit to 5
                 body_parts.append(f"- {change.model_id}: {change.field}")
-            if len(changelog.pricing_changes) > 5:
-                body_parts.append(f"- ... and {len(changelog.pricing_changes) - 5} more")
+            if counts.pricing > 5:
+                body_parts.append(f"- ... and {counts.pricing - 5} more")
             body_parts.append("")
 
-        if changelog.removed_models:
-            body_parts.append(f"Deprecated models ({len(changelog.removed_models)}):")
+        if counts.removed:
+            body_parts.append(f"Deprecated models ({counts.removed}):")
             for model_id in changelog.removed_models:
                 body_parts.append(f"- {model_id}")
             body_parts.append("")
@@ -325,18 +496,41 @@ class PRCreator:
         Returns:
             True if successful
         """
+        if not pr_url:
+            return False
+
         try:
             self.logger.info(f"Enabling auto-merge for {pr_url}")
 
             # Extract PR number from URL
             pr_number = pr_url.split("/")[-1]
 
-            # Enable auto-merge using gh CLI
-            subprocess.run(
-                ["gh", "pr", "merge", pr_number, "--auto", "--squash"],
-                cwd=self.repo_path,
-                check=True,
-            )
+            if self._use_api():
+                node_id = self._pr_node_ids.get(pr_url)
+                if node_id is None:
+                    pr = self._github_request(
+                        "GET", f"/repos/{self._get_repo_slug()}/pulls/{pr_number}"
+                    )
+                    node_id = pr["node_id"]
+                self._github_request(
+                    "POST",
+                    "/graphql",
+                    {
+                        "query": (
+                            "mutation($id: ID!) { enablePullRequestAutoMerge("
+                            "input: {pullRequestId: $id, mergeMethod: SQUASH}) "
+                            "{ clientMutationId } }"
+                        ),
+                        "variables": {"id": node_id},
+                    },
+                )
+            else:
+                # Enable auto-merge using gh CLI
+                subprocess.run(
+                    [self._gh(), "pr", "merge", pr_number, "--auto", "--squash"],
+                    cwd=self.repo_path,
+                    check=True,
+                )
 
             self.logger.info("Auto-merge enabled")
             return True
@@ -388,26 +582,35 @@ class PRCreator:
 
             body = "\n".join(body_parts)
 
-            # Create issue using gh CLI
-            result = subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "create",
-                    "--title",
-                    title,
-                    "--body",
-                    body,
-                    "--label",
-                    "maintenance,model-deprecation",
-                ],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            labels = ["maintenance", "model-deprecation"]
+            if self._use_api():
+                issue = self._github_request(
+                    "POST",
+                    f"/repos/{self._get_repo_slug()}/issues",
+                    {"title": title, "body": body, "labels": labels},
+                )
+                issue_url: str = issue["html_url"]
+            else:
+                # Create issue using gh CLI
+                result = subprocess.run(
+                    [
+                        self._gh(),
+                        "issue",
+                        "create",
+                        "--title",
+                        title,
+                        "--body",
+                        body,
+                        "--label",
+                        ",".join(labels),
+                    ],
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    check=True,
+                )
+
+                issue_url = result.stdout.decode("utf-8").strip()
 
-            issue_url = result.stdout.strip()
             self.logger.info(f"Created deprecation issue: {issue_url}")
 
             return issue_url
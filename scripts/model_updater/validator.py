@@ -4,16 +4,28 @@
 """Model data validation."""
 
 import logging
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any
+from typing import Any, Final, Optional
 
+from ai_models._compat import DATACLASS_SLOTS
 from scripts.model_updater.fetchers.base_fetcher import ModelData
 
 logger = logging.getLogger(__name__)
 
+# Reasonable ranges, kept at module level so the validators read them as globals
+_MIN_CONTEXT_WINDOW: Final[int] = 1000
+_MAX_CONTEXT_WINDOW: Final[int] = 10_000_000  # 10M tokens
+_MIN_PRICE_PER_1M: Final[float] = 0.0
+_MAX_PRICE_PER_1M: Final[float] = 1000.0  # $1000 per 1M tokens
+_MIN_RELEASE_YEAR: Final[int] = 2020
+_MAX_FUTURE_YEARS: Final[int] = 2  # Allow up to 2 years in future
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     """Result of model validation."""
 
@@ -27,41 +39,75 @@ class ModelValidator:
     """Validates fetched model data."""
 
     # Valid capability values
-    VALID_CAPABILITIES = {
-        "text_input",
-        "text_output",
-        "function_calling",
-        "vision",
-        "audio_input",
-        "audio_output",
-        "large_context",
-        "prompt_caching",
-        "streaming",
-        "json_mode",
-        "tool_use",
-    }
+    VALID_CAPABILITIES: Final[frozenset[str]] = frozenset(
+        {
+            "text_input",
+            "text_output",
+            "function_calling",
+            "vision",
+            "audio_input",
+            "audio_output",
+            "large_context",
+            "prompt_caching",
+            "streaming",
+            "json_mode",
+            "tool_use",
+        }
+    )
 
     # Valid tier values
-    VALID_COST_TIERS = {"budget", "mid-tier", "premium"}
-    VALID_SPEED_TIERS = {"fast", "balanced", "thorough"}
-
-    # Reasonable ranges
-    MIN_CONTEXT_WINDOW = 1000
-    MAX_CONTEXT_WINDOW = 10_000_000  # 10M tokens
-    MIN_PRICE_PER_1M = 0.0
-    MAX_PRICE_PER_1M = 1000.0  # $1000 per 1M tokens
-    MIN_RELEASE_YEAR = 2020
-    MAX_FUTURE_YEARS = 2  # Allow up to 2 years in future
+    VALID_COST_TIERS: Final[frozenset[str]] = frozenset({"budget", "mid-tier", "premium"})
+    VALID_SPEED_TIERS: Final[frozenset[str]] = frozenset({"fast", "balanced", "thorough"})
+
+    # Reasonable ranges (aliases of the module-level constants)
+    MIN_CONTEXT_WINDOW: Final[int] = _MIN_CONTEXT_WINDOW
+    MAX_CONTEXT_WINDOW: Final[int] = _MAX_CONTEXT_WINDOW
+    MIN_PRICE_PER_1M: Final[float] = _MIN_PRICE_PER_1M
+    MAX_PRICE_PER_1M: Final[float] = _MAX_PRICE_PER_1M
+    MIN_RELEASE_YEAR: Final[int] = _MIN_RELEASE_YEAR
+    MAX_FUTURE_YEARS: Final[int] = _MAX_FUTURE_YEARS
+
+    # Price fields as (attribute, warn when above _MAX_PRICE_PER_1M)
+    _PRICE_RULES: Final[tuple[tuple[str, bool], ...]] = (
+        ("input_per_1m", True),
+        ("output_per_1m", True),
+        ("cache_write_per_1m", False),
+        ("cache_read_per_1m", False),
+    )
+
+    # Any character outside kebab-case (alphanumerics, hyphens, dots)
+    _ID_BAD: Final[re.Pattern[str]] = re.compile(r"[^A-Za-z0-9.\-]")
 
     def __init__(self) -> None:
         """Initialize validator."""
         self.logger = logging.getLogger(self.__class__.__name__)
-
-    def validate(self, model: ModelData) -> ValidationResult:
+        # Date bounds pinned for the duration of a validate_batch() call
+        self._today_cache: Optional[date] = None
+        self._max_future_date_cache: Optional[date] = None
+        # Per-model log lines are suppressed inside a batch in favour of one summary
+        self._in_batch = False
+
+    @contextmanager
+    def _batch_context(self) -> Iterator[None]:
+        """Pin today's date and derived bounds while validating a batch."""
+        today = date.today()
+        self._today_cache = today
+        self._max_future_date_cache = date(today.year + _MAX_FUTURE_YEARS, 12, 31)
+        self._in_batch = True
+        try:
+            yield
+        finally:
+            self._today_cache = None
+            self._max_future_date_cache = None
+            self._in_batch = False
+
+    def validate(self, model: ModelData, fail_fast: bool = False) -> ValidationResult:
         """Validate a model's data.
 
         Args:
             model: ModelData object to validate
+            fail_fast: If True, skip the remaining checks once a required field
+                is missing instead of reporting every downstream error
 
         Returns:
             ValidationResult with errors and warnings
@@ -71,211 +117,272 @@ class ModelValidator:
         # Required fields
         self._check_required_fields(model, result)
 
-        # Validate identifiers
-        self._validate_identifiers(model, result)
+        if not (fail_fast and result.errors):
+            # Validate identifiers
+            self._validate_identifiers(model, result)
 
-        # Validate context windows
-        self._validate_context_windows(model, result)
+            # Validate context windows
+            self._validate_context_windows(model, result)
 
-        # Validate pricing
-        self._validate_pricing(model, result)
+            # Validate pricing
+            self._validate_pricing(model, result)
 
-        # Validate capabilities
-        self._validate_capabilities(model, result)
+            # Validate capabilities
+            self._validate_capabilities(model, result)
 
-        # Validate tiers
-        self._validate_tiers(model, result)
+            # Validate tiers
+            self._validate_tiers(model, result)
 
-        # Validate dates
-        self._validate_dates(model, result)
+            # Validate dates
+            self._validate_dates(model, result)
 
-        # Validate URLs
-        self._validate_urls(model, result)
+            # Validate URLs
+            self._validate_urls(model, result)
 
         # Set overall validity
         result.is_valid = len(result.errors) == 0
 
-        if result.errors:
-            self.logger.error(f"Validation failed for {model.model_id}: {result.errors}")
-        elif result.warnings:
-            self.logger.warning(f"Validation warnings for {model.model_id}: {result.warnings}")
-        else:
-            self.logger.info(f"Validation passed for {model.model_id}")
+        if not self._in_batch:
+            if result.errors:
+                self.logger.error("Validation failed for %s: %s", model.model_id, result.errors)
+            elif result.warnings:
+                if self.logger.isEnabledFor(logging.WARNING):
+                    self.logger.warning(
+                        "Validation warnings for %s: %s", model.model_id, result.warnings
+                    )
+            elif self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Validation passed for %s", model.model_id)
 
         return result
 
     def _check_required_fields(self, model: ModelData, result: ValidationResult) -> None:
         """Check required fields are present."""
+        errors = result.errors
         if not model.model_id:
-            result.errors.append("model_id is required")
+            errors.append("model_id is required")
         if not model.provider:
-            result.errors.append("provider is required")
+            errors.append("provider is required")
         if not model.name:
-            result.errors.append("name is required")
+            errors.append("name is required")
         if not model.api_identifier:
-            result.errors.append("api_identifier is required")
+            errors.append("api_identifier is required")
         if not model.docs_url:
-            result.errors.append("docs_url is required")
+            errors.append("docs_url is required")
 
     def _validate_identifiers(self, model: ModelData, result: ValidationResult) -> None:
         """Validate identifier formats."""
+        model_id = model.model_id
+        provider = model.provider
+
         # Model ID should be kebab-case
-        if model.model_id and not all(c.isalnum() or c in ["-", "."] for c in model.model_id):
+        if model_id and self._ID_BAD.search(model_id):
             result.warnings.append(
-                f"model_id '{model.model_id}' should use kebab-case (lowercase, hyphens, dots)"
+                f"model_id '{model_id}' should use kebab-case (lowercase, hyphens, dots)"
             )
 
         # Provider should be lowercase
-        if model.provider and model.provider != model.provider.lower():
-            result.errors.append(f"provider '{model.provider}' should be lowercase")
+        if provider and provider != provider.lower():
+            result.errors.append(f"provider '{provider}' should be lowercase")
 
     def _validate_context_windows(self, model: ModelData, result: ValidationResult) -> None:
         """Validate context window sizes."""
+        ctx_in = model.context_window_input
+        ctx_out = model.context_window_output
+
         # Input context window
-        if model.context_window_input <= 0:
-            result.errors.append(
-                f"context_window_input must be positive, got {model.context_window_input}"
-            )
-        elif model.context_window_input < self.MIN_CONTEXT_WINDOW:
-            result.warnings.append(
-                f"context_window_input ({model.context_window_input}) seems unusually small"
-            )
-        elif model.context_window_input > self.MAX_CONTEXT_WINDOW:
+        if ctx_in <= 0:
+            result.errors.append(f"context_window_input must be positive, got {ctx_in}")
+        elif ctx_in < _MIN_CONTEXT_WINDOW:
+            result.warnings.append(f"context_window_input ({ctx_in}) seems unusually small")
+        elif ctx_in > _MAX_CONTEXT_WINDOW:
             result.errors.append(
-                f"context_window_input ({model.context_window_input}) exceeds maximum "
-                f"({self.MAX_CONTEXT_WINDOW})"
+                f"context_window_input ({ctx_in}) exceeds maximum ({_MAX_CONTEXT_WINDOW})"
             )
 
         # Output context window (if specified)
-        if model.context_window_output is not None:
-            if model.context_window_output <= 0:
-                result.errors.append(
-                    f"context_window_output must be positive, got {model.context_window_output}"
-                )
-            elif model.context_window_output > model.context_window_input:
+        if ctx_out is not None:
+            if ctx_out <= 0:
+                result.errors.append(f"context_window_output must be positive, got {ctx_out}")
+            elif ctx_out > ctx_in:
                 result.warnings.append(
-                    f"context_window_output ({model.context_window_output}) larger than input "
-                    f"({model.context_window_input})"
+                    f"context_window_output ({ctx_out}) larger than input ({ctx_in})"
                 )
 
     def _validate_pricing(self, model: ModelData, result: ValidationResult) -> None:
         """Validate pricing values."""
-        # Input pricing
-        if model.input_per_1m < self.MIN_PRICE_PER_1M:
-            result.errors.append(f"input_per_1m must be non-negative, got {model.input_per_1m}")
-        elif model.input_per_1m > self.MAX_PRICE_PER_1M:
-            result.warnings.append(f"input_per_1m (${model.input_per_1m}) seems unusually high")
-
-        # Output pricing
-        if model.output_per_1m < self.MIN_PRICE_PER_1M:
-            result.errors.append(f"output_per_1m must be non-negative, got {model.output_per_1m}")
-        elif model.output_per_1m > self.MAX_PRICE_PER_1M:
-            result.warnings.append(f"output_per_1m (${model.output_per_1m}) seems unusually high")
+        # Range checks; optional (None) cache prices are skipped
+        for attr, check_max in self._PRICE_RULES:
+            value = getattr(model, attr)
+            if value is None:
+                continue
+            if value < _MIN_PRICE_PER_1M:
+                result.errors.append(f"{attr} must be non-negative, got {value}")
+            elif check_max and value > _MAX_PRICE_PER_1M:
+                result.warnings.append(f"{attr} (${value}) seems unusually high")
+
+        input_price = model.input_per_1m
+        output_price = model.output_per_1m
 
         # Output should typically cost more than input
-        if model.output_per_1m < model.input_per_1m:
+        if output_price < input_price:
             result.warnings.append(
-                f"output_per_1m (${model.output_per_1m}) is less than input_per_1m "
-                f"(${model.input_per_1m}), which is unusual"
+                f"output_per_1m (${output_price}) is less than input_per_1m "
+                f"(${input_price}), which is unusual"
             )
 
-        # Cache pricing (if specified)
-        if model.cache_write_per_1m is not None:
-            if model.cache_write_per_1m < self.MIN_PRICE_PER_1M:
-                result.errors.append(
-                    f"cache_write_per_1m must be non-negative, got {model.cache_write_per_1m}"
-                )
-            elif model.cache_write_per_1m < model.input_per_1m:
-                result.warnings.append("cache_write_per_1m should typically be >= input_per_1m")
+        # Cache pricing relative to input pricing (if specified and non-negative)
+        cache_write = model.cache_write_per_1m
+        if cache_write is not None and _MIN_PRICE_PER_1M <= cache_write < input_price:
+            result.warnings.append("cache_write_per_1m should typically be >= input_per_1m")
 
-        if model.cache_read_per_1m is not None:
-            if model.cache_read_per_1m < self.MIN_PRICE_PER_1M:
-                result.errors.append(
-                    f"cache_read_per_1m must be non-negative, got {model.cache_read_per_1m}"
-                )
-            elif model.cache_read_per_1m > model.input_per_1m:
-                result.warnings.append("cache_read_per_1m should typically be < input_per_1m")
+        cache_read = model.cache_read_per_1m
+        if cache_read is not None and cache_read >= _MIN_PRICE_PER_1M and cache_read > input_price:
+            result.warnings.append("cache_read_per_1m should typically be < input_per_1m")
 
     def _validate_capabilities(self, model: ModelData, result: ValidationResult) -> None:
         """Validate capabilities."""
-        if not model.capabilities:
+        capabilities = model.capabilities
+        if not capabilities:
             result.errors.append("At least one capability is required")
 
+        caps_set = set(capabilities)
+
         # Check for invalid capabilities
-        invalid_caps = set(model.capabilities) - self.VALID_CAPABILITIES
+        invalid_caps = caps_set - self.VALID_CAPABILITIES
         if invalid_caps:
             result.errors.append(f"Invalid capabilities: {invalid_caps}")
 
-        # Sanity checks for common capability combinations
-        caps_set = set(model.capabilities)
-
         # Should have both text_input and text_output (all LLMs do)
         if "text_output" not in caps_set:
             result.warnings.append("Model should have text_output capability")
 
     def _validate_tiers(self, model: ModelData, result: ValidationResult) -> None:
         """Validate tier classifications."""
-        if model.cost_tier not in self.VALID_COST_TIERS:
+        cost_tier = model.cost_tier
+        speed_tier = model.speed_tier
+        input_price = model.input_per_1m
+
+        if cost_tier not in self.VALID_COST_TIERS:
             result.errors.append(
-                f"Invalid cost_tier '{model.cost_tier}', must be one of {self.VALID_COST_TIERS}"
+                f"Invalid cost_tier '{cost_tier}', must be one of "
+                f"{', '.join(sorted(self.VALID_COST_TIERS))}"
             )
 
-        if model.speed_tier not in self.VALID_SPEED_TIERS:
+        if speed_tier not in self.VALID_SPEED_TIERS:
             result.errors.append(
-                f"Invalid speed_tier '{model.speed_tier}', must be one of {self.VALID_SPEED_TIERS}"
+                f"Invalid speed_tier '{speed_tier}', must be one of "
+                f"{', '.join(sorted(self.VALID_SPEED_TIERS))}"
             )
 
         # Sanity check: budget models should have lower pricing
-        if model.cost_tier == "budget" and model.input_per_1m > 1.0:
-            result.warnings.append(f"Budget model has high input price (${model.input_per_1m})")
+        if cost_tier == "budget" and input_price > 1.0:
+            result.warnings.append(f"Budget model has high input price (${input_price})")
 
         # Premium models should have higher pricing
-        if model.cost_tier == "premium" and model.input_per_1m < 5.0:
-            result.warnings.append(f"Premium model has low input price (${model.input_per_1m})")
+        if cost_tier == "premium" and input_price < 5.0:
+            result.warnings.append(f"Premium model has low input price (${input_price})")
 
     def _validate_dates(self, model: ModelData, result: ValidationResult) -> None:
         """Validate date fields."""
-        today = date.today()
+        release_date = model.release_date
 
         # Release date validation
-        if model.release_date.year < self.MIN_RELEASE_YEAR:
-            result.errors.append(f"release_date ({model.release_date}) is too far in the past")
+        if release_date.year < _MIN_RELEASE_YEAR:
+            result.errors.append(f"release_date ({release_date}) is too far in the past")
 
         # Check if release date is too far in future
-        max_future_date = date(today.year + self.MAX_FUTURE_YEARS, 12, 31)
-        if model.release_date > max_future_date:
+        max_future_date = self._max_future_date_cache
+        if max_future_date is None:
+            today = self._today_cache or date.today()
+            max_future_date = date(today.year + _MAX_FUTURE_YEARS, 12, 31)
+        if release_date > max_future_date:
             result.warnings.append(
-                f"release_date ({model.release_date}) is more than {self.MAX_FUTURE_YEARS} "
+                f"release_date ({release_date}) is more than {_MAX_FUTURE_YEARS} "
                 "years in the future"
             )
 
     def _validate_urls(self, model: ModelData, result: ValidationResult) -> None:
         """Validate URL formats."""
-        if model.docs_url:
-            if not model.docs_url.startswith(("http://", "https://")):
-                result.errors.append("docs_url must start with http:// or https://")
+        docs_url = model.docs_url
+        if docs_url and not docs_url.startswith(("http://", "https://")):
+            result.errors.append("docs_url must start with http:// or https://")
 
-    def validate_batch(self, models: list[ModelData]) -> dict[str, ValidationResult]:
+    def validate_batch(
+        self, models: list[ModelData], fail_fast: bool = False
+    ) -> dict[str, ValidationResult]:
         """Validate multiple models.
 
         Args:
             models: List of ModelData objects
+            fail_fast: Passed to validate(); skips further checks on models
+                that are missing required fields
 
         Returns:
             Dictionary mapping model_id to ValidationResult
         """
-        results = {}
-        for model in models:
-            results[model.model_id] = self.validate(model)
+        results, _ = self.validate_batch_with_summary(models, fail_fast=fail_fast)
+        return results
+
+    def validate_batch_with_summary(
+        self, models: list[ModelData], fail_fast: bool = False
+    ) -> tuple[dict[str, ValidationResult], dict[str, Any]]:
+        """Validate multiple models, tallying the summary in the same pass.
+
+        Args:
+            models: List of ModelData objects
+            fail_fast: Passed to validate(); skips further checks on models
+                that are missing required fields
+
+        Returns:
+            Tuple of (model_id to ValidationResult mapping, summary dictionary
+            in the same shape as get_validation_summary())
+        """
+        results: dict[str, ValidationResult] = {}
+        valid = total_errors = total_warnings = 0
+        # Dicts used as insertion-ordered sets so a repeated model_id can be dropped
+        failed_ids: dict[str, None] = {}
+        warned_ids: dict[str, None] = {}
+
+        with self._batch_context():
+            for model in models:
+                model_id = model.model_id
+                result = self.validate(model, fail_fast=fail_fast)
+
+                # A repeated model_id replaces the earlier result
+                previous = results.get(model_id)
+                if previous is not None:
+                    valid -= previous.is_valid
+                    total_errors -= len(previous.errors)
+                    total_warnings -= len(previous.warnings)
+                    failed_ids.pop(model_id, None)
+                    warned_ids.pop(model_id, None)
+
+                results[model_id] = result
+                valid += result.is_valid
+                total_errors += len(result.errors)
+                total_warnings += len(result.warnings)
+                if not result.is_valid:
+                    failed_ids[model_id] = None
+                elif result.warnings:
+                    warned_ids[model_id] = None
 
-        # Summary logging
         total = len(results)
-        valid = sum(1 for r in results.values() if r.is_valid)
-        invalid = total - valid
+        summary = self._build_summary(total, valid, total_errors, total_warnings)
 
-        self.logger.info(f"Batch validation complete: {valid}/{total} valid, {invalid} invalid")
+        # Summary logging: one line per outcome rather than one per model
+        if failed_ids:
+            self.logger.error(
+                "Validation failed for %d models: %s", len(failed_ids), list(failed_ids)
+            )
+        if warned_ids:
+            self.logger.warning(
+                "Validation warnings for %d models: %s", len(warned_ids), list(warned_ids)
+            )
+        self.logger.info(
+            "Batch validation complete: %d/%d valid, %d invalid", valid, total, total - valid
+        )
 
-        return results
+        return results, summary
 
     def get_validation_summary(self, results: dict[str, ValidationResult]) -> dict[str, Any]:
         """Get summary statistics from validation results.
@@ -286,16 +393,23 @@ class ModelValidator:
         Returns:
             Summary dictionary
         """
-        total = len(results)
-        valid = sum(1 for r in results.values() if r.is_valid)
-        invalid = total - valid
-        total_errors = sum(len(r.errors) for r in results.values())
-        total_warnings = sum(len(r.warnings) for r in results.values())
-
+        valid = total_errors = total_warnings = 0
+        for r in results.values():
+            valid += r.is_valid
+            total_errors += len(r.errors)
+            total_warnings += len(r.warnings)
+
+        return self._build_summary(len(results), valid, total_errors, total_warnings)
+
+    @staticmethod
+    def _build_summary(
+        total: int, valid: int, total_errors: int, total_warnings: int
+    ) -> dict[str, Any]:
+        """Assemble the summary dictionary from precomputed counts."""
         return {
             "total_models": total,
             "valid": valid,
-            "invalid": invalid,
+            "invalid": total - valid,
             "total_errors": total_errors,
             "total_warnings": total_warnings,
             "success_rate": (valid / total * 100) if total > 0 else 0,
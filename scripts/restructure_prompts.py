@@ -9,16 +9,35 @@ This script:
 3. Eliminates massive duplication across model-specific files
 """
 
+import contextlib
+import io
 import os
-import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+# Add parent directory to path so the shared `scripts` helpers import when run directly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts._prompt_patterns import COMPLEXITY_RE, TITLE_RE
+from scripts._sections import find_line_start
+
+
+def _find_first(content: str, markers: Tuple[str, ...], pos: int) -> int:
+    """Return the earliest offset at or after `pos` of any marker, or len(content)."""
+    hits = [index for index in (content.find(m, pos) for m in markers) if index != -1]
+    return min(hits, default=len(content))
 
 
 def extract_base_content(prompt_md_path: Path) -> Dict[str, str]:
     """
     Extract sections from the base prompt.md file.
 
+    Section boundaries are located with plain substring searches. They match
+    the markers literally, so markers inside code blocks still end a section.
+
     Returns dict with keys: header, overview, business_value, prompt_content
     """
     with open(prompt_md_path, "r", encoding="utf-8") as f:
@@ -26,53 +45,54 @@ def extract_base_content(prompt_md_path: Path) -> Dict[str, str]:
 
     sections = {}
 
-    # Extract header (title + metadata)
-    header_match = re.search(r"^(# .+?\n.*?(?=\n## ))", content, re.DOTALL | re.MULTILINE)
-    if header_match:
-        sections["header"] = header_match.group(1).strip()
+    # Extract header (title + metadata, up to the first ## heading)
+    title = find_line_start(content, "# ")
+    if title != -1:
+        title_end = content.find("\n", title + 3)
+        first_section = -1 if title_end == -1 else content.find("\n## ", title_end + 1)
+        if first_section != -1:
+            sections["header"] = content[title:first_section].strip()
 
-    # Extract overview section
-    overview_match = re.search(r"## Overview\n(.*?)(?=\n## |\n---|\Z)", content, re.DOTALL)
-    if overview_match:
-        sections["overview"] = overview_match.group(0).strip()
+    # Extract overview section (stops at the next heading or horizontal rule)
+    overview_start = content.find("## Overview\n")
+    if overview_start != -1:
+        overview_end = _find_first(content, ("\n## ", "\n---"), overview_start + 12)
+        sections["overview"] = content[overview_start:overview_end].strip()
 
     # Extract business value and metrics
-    business_match = re.search(
-        r"\*\*Business Value\*\*:(.*?)\*\*Production metrics\*\*:(.*?)(?=\n---|\n## |\Z)",
-        content,
-        re.DOTALL,
-    )
-    if business_match:
-        sections["business_value"] = (
-            f"**Business Value**:{business_match.group(1)}"
-            f"**Production metrics**:{business_match.group(2)}"
-        ).strip()
-
-    # Extract main prompt content (after Base Prompt heading)
-    prompt_match = re.search(
-        r"## Base Prompt \(Model Agnostic\)(.*?)(?=\n## Examples|\n---\n## Examples|\Z)",
-        content,
-        re.DOTALL,
-    )
-    if prompt_match:
-        sections["prompt_content"] = prompt_match.group(1).strip()
-
-    # Extract examples section
-    examples_match = re.search(
-        r"## Examples(.*?)(?=\n## Testing|\n## Quality|\Z)", content, re.DOTALL
-    )
-    if examples_match:
-        sections["examples"] = examples_match.group(0).strip()
+    business_start = content.find("**Business Value**:")
+    if business_start != -1:
+        metrics_start = content.find("**Production metrics**:", business_start)
+        if metrics_start != -1:
+            business_end = _find_first(content, ("\n---", "\n## "), metrics_start + 23)
+            sections["business_value"] = content[business_start:business_end].strip()
+
+    # Extract main prompt content (after Base Prompt heading, up to Examples)
+    prompt_heading = "## Base Prompt (Model Agnostic)"
+    prompt_start = content.find(prompt_heading)
+    if prompt_start != -1:
+        prompt_start += len(prompt_heading)
+        prompt_end = _find_first(content, ("\n## Examples", "\n---\n## Examples"), prompt_start)
+        sections["prompt_content"] = content[prompt_start:prompt_end].strip()
+
+    # Extract examples section (up to Testing/Quality)
+    examples_start = content.find("## Examples")
+    if examples_start != -1:
+        examples_end = _find_first(content, ("\n## Testing", "\n## Quality"), examples_start + 11)
+        sections["examples"] = content[examples_start:examples_end].strip()
 
     # Extract testing/quality sections
-    testing_match = re.search(r"(## Testing.*?## Quality.*?)(?=\n## |\Z)", content, re.DOTALL)
-    if testing_match:
-        sections["testing_quality"] = testing_match.group(1).strip()
-    elif re.search(r"## QUALITY CHECKLIST", content):
-        # Alternative: extract quality checklist
-        quality_match = re.search(r"(## QUALITY CHECKLIST.*?)(?=```|\Z)", content, re.DOTALL)
-        if quality_match:
-            sections["testing_quality"] = quality_match.group(1).strip()
+    testing_start = content.find("## Testing")
+    quality_start = -1 if testing_start == -1 else content.find("## Quality", testing_start + 10)
+    if quality_start != -1:
+        testing_end = _find_first(content, ("\n## ",), quality_start + 10)
+        sections["testing_quality"] = content[testing_start:testing_end].strip()
+    else:
+        # Alternative: extract quality checklist (which may sit inside the prompt block)
+        checklist_start = content.find("## QUALITY CHECKLIST")
+        if checklist_start != -1:
+            checklist_end = _find_first(content, ("```",), checklist_start)
+            sections["testing_quality"] = content[checklist_start:checklist_end].strip()
 
     return sections
 
@@ -95,9 +115,9 @@ def create_base_prompt(sections: Dict[str, str]) -> str:
         # Remove model-specific markers and clean up
         prompt = sections["prompt_content"]
         # Remove XML tags if present
-        prompt = re.sub(r"<task>|</task>", "", prompt)
+        prompt = prompt.replace("<task>", "").replace("</task>", "")
         # Remove complexity markers that repeat
-        prompt = re.sub(r"\n\*\*Complexity\*\*:.*?\n", "\n", prompt)
+        prompt = COMPLEXITY_RE.sub("\n", prompt)
         parts.append(prompt)
 
     if "examples" in sections:
@@ -111,26 +131,15 @@ def create_base_prompt(sections: Dict[str, str]) -> str:
     return "\n\n".join(parts)
 
 
-def create_claude_optimized(base_sections: Dict[str, str], title: str) -> str:
-    """Create Claude-optimized prompt file with minimal duplication."""
-
-    # Extract just the core prompt content
-    prompt_content = base_sections.get("prompt_content", "")
-
-    # Remove any existing wrapping
-    prompt_content = re.sub(r"^```\n|```$", "", prompt_content.strip())
-    prompt_content = re.sub(r"<task>|</task>", "", prompt_content)
+def clean_prompt_content(base_sections: Dict[str, str]) -> str:
+    """Return the core prompt content with any code fence and <task> wrapping removed."""
+    prompt_content = base_sections.get("prompt_content", "").strip()
+    prompt_content = prompt_content.removeprefix("```\n").removesuffix("```")
+    return prompt_content.replace("<task>", "").replace("</task>", "")
 
-    template = f"""# {title} - Claude Optimized
-
-> Extends `prompt.md` with Claude-specific optimizations
-
-## Prompt
-
-<task>
-{prompt_content}
-</task>
 
+# Static sections shared by every model-specific file, appended after the prompt
+_CLAUDE_SUFFIX = """\
 ## Claude Optimizations Applied
 
 - **XML structure**: `<task>` wrapper for clear task delineation
@@ -167,26 +176,7 @@ For optimal performance with Claude:
 - Provider documentation: `docs/provider-specific-prompts.md`
 """
 
-    return template
-
-
-def create_openai_optimized(base_sections: Dict[str, str], title: str) -> str:
-    """Create OpenAI-optimized prompt file with minimal duplication."""
-
-    prompt_content = base_sections.get("prompt_content", "")
-    prompt_content = re.sub(r"^```\n|```$", "", prompt_content.strip())
-    prompt_content = re.sub(r"<task>|</task>", "", prompt_content)
-
-    template = f"""# {title} - OpenAI Optimized
-
-> Extends `prompt.md` with OpenAI-specific optimizations
-
-## System Prompt
-
-```
-{prompt_content}
-```
-
+_OPENAI_SUFFIX = """\
 ## OpenAI Optimizations Applied
 
 - **System message clarity**: Explicit role and responsibilities
@@ -220,25 +210,25 @@ For structured output, combine with function schema:
 
 ```python
 # Define output schema
-output_schema = {{
+output_schema = {
     "name": "code_review_results",
     "description": "Structured code review findings",
-    "parameters": {{
+    "parameters": {
         "type": "object",
-        "properties": {{
-            "security_issues": {{"type": "array", "items": {{"type": "string"}}}},
-            "code_quality": {{"type": "array", "items": {{"type": "string"}}}},
-            "recommendations": {{"type": "array", "items": {{"type": "string"}}}}
-        }},
+        "properties": {
+            "security_issues": {"type": "array", "items": {"type": "string"}},
+            "code_quality": {"type": "array", "items": {"type": "string"}},
+            "recommendations": {"type": "array", "items": {"type": "string"}}
+        },
         "required": ["security_issues", "code_quality", "recommendations"]
-    }}
-}}
+    }
+}
 
 result = provider.generate(
     system_prompt="<prompt>",
     user_message="<content>",
     functions=[output_schema],
-    function_call={{"name": "code_review_results"}}
+    function_call={"name": "code_review_results"}
 )
 ```
 
@@ -248,26 +238,7 @@ result = provider.generate(
 - Provider documentation: `docs/provider-specific-prompts.md`
 """
 
-    return template
-
-
-def create_gemini_optimized(base_sections: Dict[str, str], title: str) -> str:
-    """Create Gemini-optimized prompt file with minimal duplication."""
-
-    prompt_content = base_sections.get("prompt_content", "")
-    prompt_content = re.sub(r"^```\n|```$", "", prompt_content.strip())
-    prompt_content = re.sub(r"<task>|</task>", "", prompt_content)
-
-    template = f"""# {title} - Gemini Optimized
-
-> Extends `prompt.md` with Gemini-specific optimizations
-
-## System Instruction
-
-```
-{prompt_content}
-```
-
+_GEMINI_SUFFIX = """\
 ## Gemini Optimizations Applied
 
 - **Clear directives**: Explicit, numbered instructions for better following
@@ -305,7 +276,7 @@ result = provider.generate(
     system_instruction="<prompt>",
     contents=[
         "Review this codebase...",
-        {{"mime_type": "image/png", "data": diagram_bytes}}
+        {"mime_type": "image/png", "data": diagram_bytes}
     ]
 )
 ```
@@ -316,9 +287,88 @@ result = provider.generate(
 - Provider documentation: `docs/provider-specific-prompts.md`
 """
 
+
+def create_claude_optimized(prompt_content: str, title: str) -> str:
+    """Create Claude-optimized prompt file with minimal duplication.
+
+    Args:
+        prompt_content: Prompt text already cleaned by clean_prompt_content()
+        title: Prompt title
+    """
+
+    template = f"""# {title} - Claude Optimized
+
+> Extends `prompt.md` with Claude-specific optimizations
+
+## Prompt
+
+<task>
+{prompt_content}
+</task>
+
+{_CLAUDE_SUFFIX}"""
+
     return template
 
 
+def create_openai_optimized(prompt_content: str, title: str) -> str:
+    """Create OpenAI-optimized prompt file with minimal duplication.
+
+    Args:
+        prompt_content: Prompt text already cleaned by clean_prompt_content()
+        title: Prompt title
+    """
+
+    template = f"""# {title} - OpenAI Optimized
+
+> Extends `prompt.md` with OpenAI-specific optimizations
+
+## System Prompt
+
+```
+{prompt_content}
+```
+
+{_OPENAI_SUFFIX}"""
+
+    return template
+
+
+def create_gemini_optimized(prompt_content: str, title: str) -> str:
+    """Create Gemini-optimized prompt file with minimal duplication.
+
+    Args:
+        prompt_content: Prompt text already cleaned by clean_prompt_content()
+        title: Prompt title
+    """
+
+    template = f"""# {title} - Gemini Optimized
+
+> Extends `prompt.md` with Gemini-specific optimizations
+
+## System Instruction
+
+```
+{prompt_content}
+```
+
+{_GEMINI_SUFFIX}"""
+
+    return template
+
+
+def replace_file(path: Path, content: str) -> None:
+    """
+    Write content to a temporary file and atomically move it over `path`.
+
+    The original inode is never truncated, so a hardlinked .bak backup of
+    `path` keeps the old content.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
 def restructure_prompt_directory(prompt_dir: Path) -> None:
     """
     Restructure a single prompt directory.
@@ -340,7 +390,7 @@ def restructure_prompt_directory(prompt_dir: Path) -> None:
     sections = extract_base_content(prompt_md)
 
     # Get title from header
-    title_match = re.search(r"^# (.+)$", sections.get("header", ""), re.MULTILINE)
+    title_match = TITLE_RE.search(sections.get("header", ""))
     title = title_match.group(1) if title_match else prompt_dir.name
 
     # Create new base prompt (clean, no duplication)
@@ -348,32 +398,47 @@ def restructure_prompt_directory(prompt_dir: Path) -> None:
 
     # Write new base prompt
     print("  ✓ Writing prompt.md")
-    with open(prompt_md, "w", encoding="utf-8") as f:
-        f.write(base_content)
+    replace_file(prompt_md, base_content)
+
+    # Clean the shared prompt body once for all model-specific files
+    prompt_content = clean_prompt_content(sections)
 
     # Create model-specific files
     claude_file = prompt_dir / "prompt.claude.md"
     print("  ✓ Writing prompt.claude.md")
-    with open(claude_file, "w", encoding="utf-8") as f:
-        f.write(create_claude_optimized(sections, title))
+    replace_file(claude_file, create_claude_optimized(prompt_content, title))
 
     openai_file = prompt_dir / "prompt.openai.md"
     print("  ✓ Writing prompt.openai.md")
-    with open(openai_file, "w", encoding="utf-8") as f:
-        f.write(create_openai_optimized(sections, title))
+    replace_file(openai_file, create_openai_optimized(prompt_content, title))
 
     gemini_file = prompt_dir / "prompt.gemini.md"
     print("  ✓ Writing prompt.gemini.md")
-    with open(gemini_file, "w", encoding="utf-8") as f:
-        f.write(create_gemini_optimized(sections, title))
+    replace_file(gemini_file, create_gemini_optimized(prompt_content, title))
 
     # Check file size reduction
-    old_size = sum(f.stat().st_size for f in prompt_dir.glob("prompt*.md.bak") if f.exists())
-    new_size = sum(f.stat().st_size for f in prompt_dir.glob("prompt*.md"))
+    old_size = new_size = 0
+    with os.scandir(prompt_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not name.startswith("prompt"):
+                continue
+            if name.endswith(".md.bak"):
+                old_size += entry.stat().st_size
+            elif name.endswith(".md"):
+                new_size += entry.stat().st_size
 
     print(f"  📊 File size: {old_size/1024:.1f}KB → {new_size/1024:.1f}KB")
 
 
+def _restructure_prompt_directory_captured(prompt_dir: Path) -> str:
+    """Run restructure_prompt_directory in a worker and return its printed report."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        restructure_prompt_directory(prompt_dir)
+    return buffer.getvalue()
+
+
 def main() -> None:
     """Main restructuring script."""
 
@@ -381,28 +446,30 @@ def main() -> None:
     prompts_dir = repo_root / "prompts"
 
     # Find all prompt directories
-    prompt_dirs = []
-    for root, dirs, files in os.walk(prompts_dir):
-        if "prompt.md" in files:
-            prompt_dirs.append(Path(root))
+    prompt_dirs = sorted(prompt_md.parent for prompt_md in prompts_dir.rglob("prompt.md"))
 
     print(f"Found {len(prompt_dirs)} prompt directories")
     print("=" * 60)
 
-    # First, backup originals
+    # First, backup originals (outputs are swapped in as new files, so links stay intact)
     for prompt_dir in prompt_dirs:
+        with os.scandir(prompt_dir) as it:
+            existing = {entry.name for entry in it}
         for md_file in prompt_dir.glob("prompt*.md"):
-            backup = md_file.with_suffix(".md.bak")
-            if not backup.exists():
-                import shutil
-
-                shutil.copy2(md_file, backup)
+            bak_name = md_file.with_suffix(".md.bak").name
+            if bak_name not in existing:
+                try:
+                    # Hardlink: free when on the same filesystem
+                    os.link(md_file, prompt_dir / bak_name)
+                except OSError:
+                    shutil.copy2(md_file, prompt_dir / bak_name)
 
     print("✓ Created backups (.md.bak)")
 
-    # Restructure each directory
-    for prompt_dir in prompt_dirs:
-        restructure_prompt_directory(prompt_dir)
+    # Restructure directories in parallel; each one is independent
+    with ProcessPoolExecutor() as pool:
+        for report in pool.map(_restructure_prompt_directory_captured, prompt_dirs, chunksize=4):
+            print(report, end="")
 
     print("\n" + "=" * 60)
     print("✅ Restructuring complete!")
@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """Verify that current models are accessible via their APIs.
 
-This script tests each model by making a minimal API call to confirm
-the model identifier is valid and the API is accessible.
+This script looks up each model through the provider's models endpoint to
+confirm the model identifier is valid and the API is accessible. This costs
+no tokens. With --deep it instead makes a minimal generation call.
 
 Usage:
     python scripts/verify_current_models.py                    # Test all models
     python scripts/verify_current_models.py --provider anthropic  # Single provider
     python scripts/verify_current_models.py --model claude-sonnet-4-5  # Single model
+    python scripts/verify_current_models.py --no-cache          # Ignore cached results
+    python scripts/verify_current_models.py --deep              # Test generation end to end
+    python scripts/verify_current_models.py --fail-fast         # Stop at the first failure
+
+Successful results are cached in ~/.cache/pm-prompt-verify for 24 hours
+(see --ttl), so repeat runs only call the APIs for models not recently verified.
 
 Requires:
     - API keys set in .env file or environment variables:
@@ -23,10 +30,28 @@ Exit codes:
 """
 
 import argparse
+import asyncio
+import hashlib
+import importlib
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
-from typing import Dict, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 # Add parent directory to path to import ai_models
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -37,6 +62,21 @@ except ImportError:
     print("Error: PyYAML not installed. Run: pip install pyyaml")
     sys.exit(2)
 
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from ai_models._compat import DATACLASS_SLOTS
+
 # Optional: Load environment variables
 try:
     from dotenv import load_dotenv
@@ -45,16 +85,319 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# Maximum in-flight verification calls per provider, to stay inside default rate limits
+PROVIDER_CONCURRENCY = {"anthropic": 5, "openai": 10, "google": 8}
+
+# Provider SDK (module, pip package) and API key environment variable
+PROVIDER_SDKS = {
+    "anthropic": ("anthropic", "anthropic"),
+    "openai": ("openai", "openai"),
+    "google": ("google.generativeai", "google-generativeai"),
+}
+PROVIDER_API_KEYS = {
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "google": "GOOGLE_API_KEY",
+}
+
+# Requests per minute per provider, matching default API tier limits
+PROVIDER_RPM = {"anthropic": 50, "openai": 60, "google": 60}
+
+# Backoff for calls that still hit a provider rate limit
+RATE_LIMIT_ATTEMPTS = 4
+RATE_LIMIT_WAIT = wait_random_exponential(multiplier=1, max=30)
+
+# Successful results are reused across runs until they are this old
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pm-prompt-verify"
+DEFAULT_CACHE_TTL_HOURS = 24.0
+
+# Threads used to read and parse definition files
+YAML_LOAD_WORKERS = 8
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class VerifyResult:
+    """Outcome of verifying one model."""
+
+    success: bool
+    provider: str = ""
+    model_id: str = ""
+    api_identifier: Optional[str] = None
+    error: Optional[str] = None
+    skip_reason: Optional[str] = None
+    response_model: Optional[str] = None
+    response_text_preview: Optional[str] = None
+    tokens_used: int = 0
+    cache_hit: bool = False
+
+
+_RESULT_FIELDS = frozenset(f.name for f in fields(VerifyResult))
+
+
+def _import_optional(module_name: str) -> Any:
+    """Import a provider SDK, returning None if it is not installed."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+def _outcome(result: VerifyResult) -> str:
+    """Classify a result as "passed", "failed" or "skipped"."""
+    if result.skip_reason is not None:
+        return "skipped"
+    return "passed" if result.success else "failed"
+
+
+def _load_definition(yaml_file: str) -> Any:
+    """Parse one model definition file."""
+    with open(yaml_file) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` calls per `period` seconds, in bursts of up to `rate`.
+
+    Must be created inside the event loop that uses it.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0) -> None:
+        """Initialize a full bucket."""
+        self._capacity = rate
+        self._tokens = rate
+        self._refill_per_second = rate / period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._refill_per_second
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Tokens are not returned; they refill over time."""
+
 
 class ModelVerifier:
     """Verify model API endpoints."""
 
-    def __init__(self):  # type: ignore[no-untyped-def]
-        """Initialize verifier."""
-        self.results: Dict[str, Dict[str, any]] = {}  # type: ignore[valid-type]
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS,
+        quiet: bool = False,
+        deep: bool = False,
+    ) -> None:
+        """Initialize verifier.
+
+        Args:
+            cache_dir: Directory for the persistent result cache, or None to disable it
+            cache_ttl_hours: How long a cached successful result stays valid
+            quiet: Don't print a status line per model (e.g. when emitting JSON)
+            deep: Verify with a minimal generation call instead of a metadata lookup
+        """
+        self.results: Dict[str, VerifyResult] = {}
+        # Outcome tallies, kept in step with self.results as models are recorded
+        self.counts = {"passed": 0, "failed": 0, "skipped": 0}
+        self.quiet = quiet
+        self.deep = deep
         self.definitions_dir = Path(__file__).parent.parent / "ai_models" / "definitions"
+        # SDKs and API keys are looked up once; None marks what is missing
+        self._sdks = {
+            provider: _import_optional(module) for provider, (module, _) in PROVIDER_SDKS.items()
+        }
+        self._api_keys = {provider: os.getenv(var) for provider, var in PROVIDER_API_KEYS.items()}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._limiters: Dict[str, RateLimiter] = {}
+        # Async SDK clients shared by every call in a run, so connections are reused
+        self._clients: Dict[str, Any] = {}
+        self._genai_configured = False
+        # Successful results keyed by (provider, api_identifier), shared by aliases
+        self._call_cache: Dict[Tuple[str, str], VerifyResult] = {}
+        # Persistent results: sha256 key -> {"timestamp": ..., "result": ...}
+        self._cache_file = cache_dir / "results.json" if cache_dir else None
+        self._cache_ttl = cache_ttl_hours * 3600
+        self._disk_cache: Dict[str, Dict[str, Any]] = {}
+        self._disk_cache_dirty = False
+        self._dispatch: Dict[str, Callable[[str, str], Awaitable[VerifyResult]]] = {
+            "anthropic": self.verify_anthropic_model,
+            "openai": self.verify_openai_model,
+            "google": self.verify_google_model,
+        }
+
+    def _unavailable(self, provider: str) -> Optional[VerifyResult]:
+        """Return a skip result if the provider's SDK or API key is missing, else None."""
+        if provider not in PROVIDER_SDKS:
+            return None
+        if self._sdks[provider] is None:
+            return VerifyResult(
+                success=False,
+                error=f"{PROVIDER_SDKS[provider][1]} package not installed",
+                skip_reason="missing_dependency",
+            )
+        if not self._api_keys[provider]:
+            return VerifyResult(
+                success=False,
+                error=f"{PROVIDER_API_KEYS[provider]} not set",
+                skip_reason="missing_api_key",
+            )
+        return None
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        """Return the provider's concurrency limit, created inside the running event loop."""
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(PROVIDER_CONCURRENCY[provider])
+            self._semaphores[provider] = semaphore
+        return semaphore
+
+    def _limiter(self, provider: str) -> RateLimiter:
+        """Return the provider's request-rate limiter, created inside the running event loop."""
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            limiter = self._limiters[provider] = RateLimiter(PROVIDER_RPM[provider])
+        return limiter
+
+    async def _call(
+        self,
+        provider: str,
+        request: Callable[[], Awaitable[Any]],
+        rate_limit_error: Type[BaseException],
+    ) -> Any:
+        """Make a provider API call within its concurrency and rate limits.
+
+        Args:
+            provider: Provider name (key of PROVIDER_CONCURRENCY / PROVIDER_RPM)
+            request: Zero-argument function returning the API call's awaitable
+            rate_limit_error: Provider exception signalling a rate limit; retried with backoff
+
+        Returns:
+            The API response
+        """
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(rate_limit_error),
+            wait=RATE_LIMIT_WAIT,
+            stop=stop_after_attempt(RATE_LIMIT_ATTEMPTS),
+            reraise=True,
+        ):
+            with attempt:
+                async with self._semaphore(provider), self._limiter(provider):
+                    response = await request()
+        return response
+
+    def _client(self, provider: str, factory: Callable[[], Any]) -> Any:
+        """Return the provider's shared async client, creating it on first use."""
+        client = self._clients.get(provider)
+        if client is None:
+            client = self._clients[provider] = factory()
+        return client
+
+    def _cache_key(self, provider: str, api_identifier: str) -> str:
+        """Return the persistent cache key for a provider's API identifier and check depth."""
+        mode = "deep" if self.deep else "lookup"
+        return hashlib.sha256(f"{provider}|{api_identifier}|{mode}".encode()).hexdigest()
+
+    def _load_disk_cache(self) -> None:
+        """Load persisted results; a missing, unreadable or malformed cache file counts as empty."""
+        self._disk_cache = {}
+        self._disk_cache_dirty = False
+        if self._cache_file is None:
+            return
+        try:
+            data = json.loads(self._cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._disk_cache = data
+
+    def _save_disk_cache(self) -> None:
+        """Persist results recorded during this run."""
+        if self._cache_file is None or not self._disk_cache_dirty:
+            return
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_file.write_text(json.dumps(self._disk_cache), encoding="utf-8")
+        except OSError as e:
+            print(f"Warning: Could not write result cache {self._cache_file}: {e}", file=sys.stderr)
+        self._disk_cache_dirty = False
 
-    def verify_anthropic_model(self, model_id: str, api_identifier: str) -> Dict[str, any]:  # type: ignore[valid-type]
+    def _get_disk_cached(self, provider: str, api_identifier: str) -> Optional[VerifyResult]:
+        """Return a persisted successful result if it is still within the TTL.
+
+        Malformed entries are discarded and treated as a cache miss.
+        """
+        key = self._cache_key(provider, api_identifier)
+        entry = self._disk_cache.get(key)
+        if entry is None:
+            return None
+        try:
+            timestamp = entry["timestamp"]
+            if isinstance(timestamp, bool) or not isinstance(timestamp, (int, float)):
+                raise TypeError("timestamp is not a number")
+            if time.time() - timestamp >= self._cache_ttl:
+                return None
+            stored = {k: v for k, v in entry["result"].items() if k in _RESULT_FIELDS}
+            return replace(VerifyResult(**stored), cache_hit=True)
+        except (KeyError, TypeError, AttributeError):
+            del self._disk_cache[key]
+            self._disk_cache_dirty = True
+            return None
+
+    def _put_disk_cached(self, provider: str, api_identifier: str, result: VerifyResult) -> None:
+        """Record a successful result for later runs."""
+        if self._cache_file is None:
+            return
+        self._disk_cache[self._cache_key(provider, api_identifier)] = {
+            "timestamp": time.time(),
+            "result": asdict(result),
+        }
+        self._disk_cache_dirty = True
+
+    async def _close_clients(self) -> None:
+        """Close the shared clients and their pooled connections."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.close()
+
+    async def _safe_call(
+        self,
+        api_identifier: str,
+        check: Callable[[], Awaitable[VerifyResult]],
+        not_found: Tuple[Type[BaseException], ...] = (),
+        auth_error: Tuple[Type[BaseException], ...] = (),
+    ) -> VerifyResult:
+        """Run a provider check, turning its exceptions into result dictionaries.
+
+        Args:
+            api_identifier: Provider's API model identifier, for the not-found message
+            check: Zero-argument coroutine function returning the success result
+            not_found: Provider exceptions meaning the model doesn't exist
+            auth_error: Provider exceptions meaning the API key was rejected
+
+        Returns:
+            Verification result
+        """
+        try:
+            return await check()
+        except not_found:
+            return VerifyResult(success=False, error=f"Model not found: {api_identifier}")
+        except auth_error:
+            return VerifyResult(
+                success=False, error="Authentication failed", skip_reason="auth_error"
+            )
+        except Exception as e:
+            return VerifyResult(success=False, error=f"{type(e).__name__}: {str(e)}")
+
+    async def verify_anthropic_model(self, model_id: str, api_identifier: str) -> VerifyResult:
         """Verify Anthropic model.
 
         Args:
@@ -62,46 +405,52 @@ class ModelVerifier:
             api_identifier: Anthropic API model identifier
 
         Returns:
-            Result dictionary with success/failure info
+            Verification result
         """
-        try:
-            import anthropic
-        except ImportError:
-            return {
-                "success": False,
-                "error": "anthropic package not installed",
-                "skip_reason": "missing_dependency",
-            }
-
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            return {
-                "success": False,
-                "error": "ANTHROPIC_API_KEY not set",
-                "skip_reason": "missing_api_key",
-            }
+        skip = self._unavailable("anthropic")
+        if skip:
+            return skip
+        anthropic = self._sdks["anthropic"]
+        api_key = self._api_keys["anthropic"]
+
+        async def check() -> VerifyResult:
+            client = self._client("anthropic", lambda: anthropic.AsyncAnthropic(api_key=api_key))
+            if self.deep:
+                response = await self._call(
+                    "anthropic",
+                    lambda: client.messages.create(
+                        model=api_identifier,
+                        max_tokens=10,
+                        messages=[{"role": "user", "content": "Hi"}],
+                    ),
+                    anthropic.RateLimitError,
+                )
+
+                return VerifyResult(
+                    success=True,
+                    api_identifier=api_identifier,
+                    response_model=response.model,
+                    tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+                )
+
+            model_info = await self._call(
+                "anthropic",
+                lambda: client.models.retrieve(api_identifier),
+                anthropic.RateLimitError,
+            )
 
-        try:
-            client = anthropic.Anthropic(api_key=api_key)
-            response = client.messages.create(
-                model=api_identifier, max_tokens=10, messages=[{"role": "user", "content": "Hi"}]
+            return VerifyResult(
+                success=True, api_identifier=api_identifier, response_model=model_info.id
             )
 
-            return {
-                "success": True,
-                "api_identifier": api_identifier,
-                "response_model": response.model,
-                "tokens_used": response.usage.input_tokens + response.usage.output_tokens,
-            }
-
-        except anthropic.NotFoundError:
-            return {"success": False, "error": f"Model not found: {api_identifier}"}
-        except anthropic.AuthenticationError:
-            return {"success": False, "error": "Authentication failed", "skip_reason": "auth_error"}
-        except Exception as e:
-            return {"success": False, "error": f"{type(e).__name__}: {str(e)}"}
+        return await self._safe_call(
+            api_identifier,
+            check,
+            not_found=(anthropic.NotFoundError,),
+            auth_error=(anthropic.AuthenticationError,),
+        )
 
-    def verify_openai_model(self, model_id: str, api_identifier: str) -> Dict[str, any]:  # type: ignore[valid-type]
+    async def verify_openai_model(self, model_id: str, api_identifier: str) -> VerifyResult:
         """Verify OpenAI model.
 
         Args:
@@ -109,48 +458,52 @@ class ModelVerifier:
             api_identifier: OpenAI API model identifier
 
         Returns:
-            Result dictionary with success/failure info
+            Verification result
         """
-        try:
-            import openai
-        except ImportError:
-            return {
-                "success": False,
-                "error": "openai package not installed",
-                "skip_reason": "missing_dependency",
-            }
-
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            return {
-                "success": False,
-                "error": "OPENAI_API_KEY not set",
-                "skip_reason": "missing_api_key",
-            }
+        skip = self._unavailable("openai")
+        if skip:
+            return skip
+        openai = self._sdks["openai"]
+        api_key = self._api_keys["openai"]
+
+        async def check() -> VerifyResult:
+            client = self._client("openai", lambda: openai.AsyncOpenAI(api_key=api_key))
+            if self.deep:
+                response = await self._call(
+                    "openai",
+                    lambda: client.chat.completions.create(
+                        model=api_identifier,
+                        max_tokens=10,
+                        messages=[{"role": "user", "content": "Hi"}],
+                    ),
+                    openai.RateLimitError,
+                )
+
+                return VerifyResult(
+                    success=True,
+                    api_identifier=api_identifier,
+                    response_model=response.model,
+                    tokens_used=response.usage.total_tokens,
+                )
+
+            model_info = await self._call(
+                "openai",
+                lambda: client.models.retrieve(api_identifier),
+                openai.RateLimitError,
+            )
 
-        try:
-            client = openai.OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model=api_identifier,
-                max_tokens=10,
-                messages=[{"role": "user", "content": "Hi"}],
+            return VerifyResult(
+                success=True, api_identifier=api_identifier, response_model=model_info.id
             )
 
-            return {
-                "success": True,
-                "api_identifier": api_identifier,
-                "response_model": response.model,
-                "tokens_used": response.usage.total_tokens,  # type: ignore[union-attr]
-            }
-
-        except openai.NotFoundError:
-            return {"success": False, "error": f"Model not found: {api_identifier}"}
-        except openai.AuthenticationError:
-            return {"success": False, "error": "Authentication failed", "skip_reason": "auth_error"}
-        except Exception as e:
-            return {"success": False, "error": f"{type(e).__name__}: {str(e)}"}
+        return await self._safe_call(
+            api_identifier,
+            check,
+            not_found=(openai.NotFoundError,),
+            auth_error=(openai.AuthenticationError,),
+        )
 
-    def verify_google_model(self, model_id: str, api_identifier: str) -> Dict[str, any]:  # type: ignore[valid-type]
+    async def verify_google_model(self, model_id: str, api_identifier: str) -> VerifyResult:
         """Verify Google Gemini model.
 
         Args:
@@ -158,50 +511,66 @@ class ModelVerifier:
             api_identifier: Google API model identifier
 
         Returns:
-            Result dictionary with success/failure info
+            Verification result
         """
-        try:
-            import google.generativeai as genai
-        except ImportError:
-            return {
-                "success": False,
-                "error": "google-generativeai package not installed",
-                "skip_reason": "missing_dependency",
-            }
-
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            return {
-                "success": False,
-                "error": "GOOGLE_API_KEY not set",
-                "skip_reason": "missing_api_key",
-            }
-
-        try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel(api_identifier)
-            response = model.generate_content("Hi", generation_config={"max_output_tokens": 10})
+        skip = self._unavailable("google")
+        if skip:
+            return skip
+        genai = self._sdks["google"]
+        api_key = self._api_keys["google"]
+        from google.api_core import exceptions as google_exceptions
+
+        async def check() -> VerifyResult:
+            if not self._genai_configured:
+                genai.configure(api_key=api_key)
+                self._genai_configured = True
+            if self.deep:
+                model = genai.GenerativeModel(api_identifier)
+                response = await self._call(
+                    "google",
+                    lambda: model.generate_content_async(
+                        "Hi", generation_config={"max_output_tokens": 10}
+                    ),
+                    google_exceptions.ResourceExhausted,
+                )
+
+                return VerifyResult(
+                    success=True,
+                    api_identifier=api_identifier,
+                    response_text_preview=response.text[:50] if response.text else "",
+                )
+
+            # genai has no async model lookup, so run it in the default executor
+            loop = asyncio.get_running_loop()
+            model_info = await self._call(
+                "google",
+                lambda: loop.run_in_executor(None, genai.get_model, f"models/{api_identifier}"),
+                google_exceptions.ResourceExhausted,
+            )
 
-            return {
-                "success": True,
-                "api_identifier": api_identifier,
-                "response_text_preview": response.text[:50] if response.text else "",
-            }
+            return VerifyResult(
+                success=True, api_identifier=api_identifier, response_model=model_info.name
+            )
 
-        except Exception as e:
-            error_msg = str(e)
-            if "API_KEY_INVALID" in error_msg or "authentication" in error_msg.lower():
-                return {
-                    "success": False,
-                    "error": "Authentication failed",
-                    "skip_reason": "auth_error",
-                }
-            elif "not found" in error_msg.lower():
-                return {"success": False, "error": f"Model not found: {api_identifier}"}
-            else:
-                return {"success": False, "error": f"{type(e).__name__}: {error_msg}"}
-
-    def verify_model(self, provider: str, model_id: str, api_identifier: str) -> Dict[str, any]:  # type: ignore[valid-type]
+        async def keyed_check() -> VerifyResult:
+            try:
+                return await check()
+            except google_exceptions.InvalidArgument as e:
+                # A bad API key is rejected as an invalid argument, identified by its reason
+                if e.reason == "API_KEY_INVALID":
+                    return VerifyResult(
+                        success=False, error="Authentication failed", skip_reason="auth_error"
+                    )
+                raise
+
+        return await self._safe_call(
+            api_identifier,
+            keyed_check,
+            not_found=(google_exceptions.NotFound,),
+            auth_error=(google_exceptions.PermissionDenied, google_exceptions.Unauthenticated),
+        )
+
+    async def verify_model(self, provider: str, model_id: str, api_identifier: str) -> VerifyResult:
         """Verify a model based on its provider.
 
         Args:
@@ -210,49 +579,163 @@ class ModelVerifier:
             api_identifier: Provider's API model identifier
 
         Returns:
-            Result dictionary
+            Verification result
         """
-        if provider.lower() == "anthropic":
-            return self.verify_anthropic_model(model_id, api_identifier)
-        elif provider.lower() == "openai":
-            return self.verify_openai_model(model_id, api_identifier)
-        elif provider.lower() == "google":
-            return self.verify_google_model(model_id, api_identifier)
-        else:
-            return {"success": False, "error": f"Unknown provider: {provider}"}
+        verify = self._dispatch.get(provider.lower())
+        if verify is None:
+            return VerifyResult(success=False, error=f"Unknown provider: {provider}")
+        return await verify(model_id, api_identifier)
+
+    async def _verify_cached(
+        self, provider: str, model_id: str, api_identifier: str
+    ) -> VerifyResult:
+        """Verify a model unless the same API identifier already verified successfully.
 
-    def verify_all_models(
-        self, provider_filter: Optional[str] = None, model_filter: Optional[str] = None
-    ) -> Dict[str, Dict[str, any]]:  # type: ignore[valid-type]
+        Args:
+            provider: Provider name
+            model_id: Internal model ID
+            api_identifier: Provider's API model identifier
+
+        Returns:
+            Verification result, shared by every alias of the API identifier
+        """
+        key = (provider.lower(), api_identifier)
+        result = self._call_cache.get(key) or self._get_disk_cached(*key)
+        if result is None:
+            result = await self.verify_model(provider, model_id, api_identifier)
+            # Failures are never cached, so transient errors don't stick
+            if result.success:
+                self._put_disk_cached(*key, result)
+        if result.success:
+            self._call_cache[key] = result
+        return result
+
+    def _iter_definition_files(self) -> Iterator[Tuple[str, str]]:
+        """Yield (provider_name, path) for each definitions/<provider>/*.yaml file.
+
+        Provider names are lowercased here, once per directory.
+        """
+        with os.scandir(self.definitions_dir) as providers:
+            for provider_entry in providers:
+                if not provider_entry.is_dir():
+                    continue
+                provider_name = provider_entry.name.lower()
+                with os.scandir(provider_entry.path) as files:
+                    for file_entry in files:
+                        if file_entry.name.endswith(".yaml"):
+                            yield provider_name, file_entry.path
+
+    async def _verify_keyed(
+        self, key: Tuple[str, str], call: Tuple[str, str, str]
+    ) -> Tuple[Tuple[str, str], Union[VerifyResult, Exception]]:
+        """Run _verify_cached for a call, returning its key with the result or exception."""
+        try:
+            return key, await self._verify_cached(*call)
+        except Exception as e:
+            return key, e
+
+    def _record(
+        self,
+        provider_name: str,
+        model_id: str,
+        api_identifier: Optional[str],
+        result: VerifyResult,
+    ) -> None:
+        """Store a model's result, update the tallies and print its one-line status."""
+        result = replace(result, provider=provider_name, model_id=model_id)
+        previous = self.results.get(model_id)
+        if previous is not None:
+            self.counts[_outcome(previous)] -= 1
+        self.results[model_id] = result
+        self.counts[_outcome(result)] += 1
+
+        if self.quiet:
+            return
+
+        if result.cache_hit:
+            status = "✅ PASS (cached)"
+        elif result.success:
+            status = "✅ PASS"
+        elif result.skip_reason is not None:
+            status = f"⏭️  SKIP ({result.skip_reason})"
+        else:
+            status = f"❌ FAIL: {result.error or 'Unknown error'}"
+        label = f"{model_id} ({api_identifier})" if api_identifier else model_id
+        print(f"\nTesting {label}... {status}")
+
+    async def verify_all_models(
+        self,
+        provider_filter: Optional[str] = None,
+        model_filter: Optional[str] = None,
+        fail_fast: bool = False,
+    ) -> Dict[str, VerifyResult]:
         """Verify all model definitions.
 
+        Models are verified concurrently, bounded per provider by
+        PROVIDER_CONCURRENCY, so the run takes roughly as long as the slowest
+        provider's share of calls rather than the sum of every call. Results are
+        reported in completion order.
+
         Args:
             provider_filter: Only check models from this provider
             model_filter: Only check this specific model
+            fail_fast: Cancel outstanding calls as soon as one model fails
 
         Returns:
             Dictionary mapping model_id to result
         """
         if not self.definitions_dir.exists():
-            print(f"Error: Definitions directory not found: {self.definitions_dir}")
+            print(
+                f"Error: Definitions directory not found: {self.definitions_dir}", file=sys.stderr
+            )
             sys.exit(2)
 
-        yaml_files = list(self.definitions_dir.rglob("*.yaml"))
+        yaml_files = list(self._iter_definition_files())
 
         if not yaml_files:
-            print(f"Warning: No model definitions found in {self.definitions_dir}")
+            print(f"Warning: No model definitions found in {self.definitions_dir}", file=sys.stderr)
             return {}
 
-        for yaml_file in yaml_files:
-            provider_name = yaml_file.parent.name
-
-            # Apply filters
-            if provider_filter and provider_name.lower() != provider_filter.lower():
+        # Semaphores and limiters are bound to the event loop, so start fresh for each run
+        self._semaphores = {}
+        self._limiters = {}
+        self._load_disk_cache()
+
+        # Apply the provider filter before reading anything
+        if provider_filter:
+            provider_filter = provider_filter.lower()
+            yaml_files = [
+                (provider, path) for provider, path in yaml_files if provider == provider_filter
+            ]
+
+        # Providers missing an SDK or API key are skipped without reading their files;
+        # definition files are named after their model_id
+        definition_files = []
+        for provider_name, path in yaml_files:
+            skip = self._unavailable(provider_name)
+            if skip is None:
+                definition_files.append((provider_name, path))
                 continue
+            model_id = Path(path).stem
+            if not model_filter or model_id == model_filter:
+                self._record(provider_name, model_id, None, skip)
+
+        # Read and parse definitions in worker threads, off the event loop
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=YAML_LOAD_WORKERS) as pool:
+            definitions = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _load_definition, path)
+                    for _, path in definition_files
+                ),
+                return_exceptions=True,
+            )
 
+        jobs = []
+        for (provider_name, yaml_file), data in zip(definition_files, definitions):
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                if isinstance(data, BaseException):
+                    raise data
 
                 if not data or "model_id" not in data:
                     continue
@@ -263,26 +746,44 @@ class ModelVerifier:
                     continue
 
                 api_identifier = data.get("api_identifier", model_id)
-
-                print(f"\nTesting {model_id} ({api_identifier})...", end=" ")
-
-                result = self.verify_model(provider_name, model_id, api_identifier)
-                result["provider"] = provider_name
-                result["model_id"] = model_id
-                self.results[model_id] = result
-
-                # Print immediate feedback
-                if result["success"]:
-                    print("✅ PASS")
-                elif "skip_reason" in result:
-                    print(f"⏭️  SKIP ({result.get('skip_reason')})")
-                else:
-                    print(f"❌ FAIL: {result.get('error', 'Unknown error')}")
+                jobs.append((yaml_file, provider_name, model_id, api_identifier))
 
             except Exception as e:
-                print(f"Error processing {yaml_file}: {e}")
+                print(f"Error processing {yaml_file}: {e}", file=sys.stderr)
                 continue
 
+        # One call per (provider, api_identifier); aliases share its result
+        groups: Dict[Tuple[str, str], List[Tuple[str, str, str, str]]] = {}
+        for job in jobs:
+            _, provider_name, _, api_identifier = job
+            groups.setdefault((provider_name, api_identifier), []).append(job)
+
+        tasks = [
+            asyncio.create_task(self._verify_keyed(key, group[0][1:]))
+            for key, group in groups.items()
+        ]
+        try:
+            # Report each result as soon as its call finishes
+            for next_done in asyncio.as_completed(tasks):
+                key, result = await next_done
+                for yaml_file, provider_name, model_id, api_identifier in groups[key]:
+                    if isinstance(result, Exception):
+                        print(f"Error processing {yaml_file}: {result}", file=sys.stderr)
+                        continue
+
+                    self._record(provider_name, model_id, api_identifier, result)
+
+                if fail_fast and isinstance(result, VerifyResult) and _outcome(result) == "failed":
+                    break
+        finally:
+            # Stop any calls still running (after --fail-fast) before tearing down
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Clients are bound to this event loop, so don't carry them into the next run
+            await self._close_clients()
+            self._save_disk_cache()
+
         return self.results
 
     def print_summary(self) -> None:
@@ -291,43 +792,40 @@ class ModelVerifier:
             print("\nNo models tested.")
             return
 
-        passed = [m for m in self.results.values() if m["success"]]
-        failed = [m for m in self.results.values() if not m["success"] and "skip_reason" not in m]
-        skipped = [m for m in self.results.values() if "skip_reason" in m]
+        # One pass: collect failures and group skipped models by skip reason
+        failed: List[VerifyResult] = []
+        skipped_by_reason: Dict[str, List[VerifyResult]] = {}
+        for result in self.results.values():
+            if result.skip_reason is not None:
+                skipped_by_reason.setdefault(result.skip_reason, []).append(result)
+            elif not result.success:
+                failed.append(result)
 
         print("\n" + "=" * 80)
         print("MODEL VERIFICATION SUMMARY")
         print("=" * 80)
         print(f"\nTotal Models: {len(self.results)}")
-        print(f"  ✅ Passed:  {len(passed)}")
-        print(f"  ❌ Failed:  {len(failed)}")
-        print(f"  ⏭️  Skipped: {len(skipped)}")
+        print(f"  ✅ Passed:  {self.counts['passed']}")
+        print(f"  ❌ Failed:  {self.counts['failed']}")
+        print(f"  ⏭️  Skipped: {self.counts['skipped']}")
 
         if failed:
             print("\n" + "-" * 80)
             print("FAILED MODELS")
             print("-" * 80)
             for result in failed:
-                print(f"\n  • {result['model_id']} ({result['provider']})")
-                print(f"    Error: {result.get('error', 'Unknown error')}")
+                print(f"\n  • {result.model_id} ({result.provider})")
+                print(f"    Error: {result.error or 'Unknown error'}")
 
-        if skipped:
+        if skipped_by_reason:
             print("\n" + "-" * 80)
             print("SKIPPED MODELS")
             print("-" * 80)
 
-            # Group by skip reason
-            by_reason = {}  # type: ignore[var-annotated]
-            for result in skipped:
-                reason = result.get("skip_reason", "unknown")
-                if reason not in by_reason:
-                    by_reason[reason] = []
-                by_reason[reason].append(result)
-
-            for reason, models in by_reason.items():
+            for reason, models in skipped_by_reason.items():
                 print(f"\n  {reason}:")
                 for result in models:
-                    print(f"    • {result['model_id']} ({result['provider']})")
+                    print(f"    • {result.model_id} ({result.provider})")
 
         print("\n" + "=" * 80 + "\n")
 
@@ -342,6 +840,9 @@ Examples:
   python scripts/verify_current_models.py                    # Test all models
   python scripts/verify_current_models.py --provider anthropic  # Single provider
   python scripts/verify_current_models.py --model claude-sonnet-4-5  # Single model
+  python scripts/verify_current_models.py --no-cache          # Ignore cached results
+  python scripts/verify_current_models.py --json              # Machine-readable report
+  python scripts/verify_current_models.py --deep              # Test generation end to end
 
 API Keys Required:
   Set in .env file or environment:
@@ -353,24 +854,66 @@ API Keys Required:
 
     parser.add_argument(
         "--provider",
-        type=str,
-        help="Only test models from this provider (anthropic, openai, google)",
+        type=str.lower,
+        choices=list(PROVIDER_SDKS),
+        help="Only test models from this provider",
     )
 
     parser.add_argument("--model", type=str, help="Only test this specific model")
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-test every model instead of reusing recent successful results",
+    )
 
-    verifier = ModelVerifier()  # type: ignore[no-untyped-call]
-    verifier.verify_all_models(provider_filter=args.provider, model_filter=args.model)
-    verifier.print_summary()
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL_HOURS,
+        help=f"Hours a cached successful result stays valid (default: {DEFAULT_CACHE_TTL_HOURS:g})",
+    )
 
-    # Exit with code 1 if any models failed (not counting skipped)
-    failed_count = sum(
-        1 for r in verifier.results.values() if not r["success"] and "skip_reason" not in r
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Verify with a minimal generation call (uses tokens) instead of a model lookup",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failed model instead of testing the rest",
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON report of all results instead of per-model lines and a summary",
     )
 
-    return 1 if failed_count > 0 else 0
+    args = parser.parse_args()
+
+    verifier = ModelVerifier(
+        cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
+        cache_ttl_hours=args.ttl,
+        quiet=args.json,
+        deep=args.deep,
+    )
+    asyncio.run(
+        verifier.verify_all_models(
+            provider_filter=args.provider, model_filter=args.model, fail_fast=args.fail_fast
+        )
+    )
+    if args.json:
+        report = {model_id: asdict(result) for model_id, result in verifier.results.items()}
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        verifier.print_summary()
+
+    # Exit with code 1 if any models failed (not counting skipped)
+    return 1 if verifier.counts["failed"] > 0 else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""Shared pytest fixtures."""
+
+import pytest
+
+from ai_models import ModelRegistry, PricingService
+from ai_models.registry import Model
+
+
+@pytest.fixture(scope="session")
+def models() -> dict[str, Model]:
+    """All registered models, loaded once per test session."""
+    # Start from the real definitions even if an earlier test left mocked data loaded
+    ModelRegistry.clear_cache()
+    return ModelRegistry.get_all()
+
+
+@pytest.fixture(scope="session")
+def pricing_service() -> PricingService:
+    """Pricing service shared by tests that only read prices."""
+    return PricingService()
@@ -7,12 +7,10 @@ Additional tests for ai_models/capabilities.py to achieve 90%+ coverage.
 Focuses on edge cases, error handling, and untested code paths.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
-from unittest.mock import Mock, mock_open, patch
 
 import pytest
-import yaml
 
 from ai_models.capabilities import (
     CapabilityValidator,
@@ -24,6 +22,13 @@ from ai_models.capabilities import (
 )
 
 
+@pytest.fixture(scope="module")
+def loaded_caps() -> None:
+    """Load capabilities from the real definitions once for the real-data tests."""
+    CapabilityValidator.clear_cache()
+    CapabilityValidator._load_capabilities()
+
+
 class TestModelCapabilityEnum:
     """Test ModelCapability enum functionality."""
 
@@ -39,135 +44,93 @@ class TestModelCapabilityEnum:
         assert "vision" in error_msg
         assert "function_calling" in error_msg
 
-    def test_from_string_with_valid_capabilities(self) -> None:
-        """Test from_string correctly converts valid capability strings."""
-        assert ModelCapability.from_string("vision") == ModelCapability.VISION
-        assert ModelCapability.from_string("function_calling") == ModelCapability.FUNCTION_CALLING
-        assert ModelCapability.from_string("prompt_caching") == ModelCapability.PROMPT_CACHING
-        assert ModelCapability.from_string("streaming") == ModelCapability.STREAMING
-
-    def test_str_representation(self) -> None:
-        """Test __str__ returns the value."""
-        assert str(ModelCapability.VISION) == "vision"
-        assert str(ModelCapability.FUNCTION_CALLING) == "function_calling"
-        assert str(ModelCapability.LARGE_CONTEXT) == "large_context"
-
-    def test_all_capabilities_have_string_values(self) -> None:
-        """Test that all capabilities can be converted to/from strings."""
-        for cap in ModelCapability:
-            # Should be able to convert to string and back
-            cap_str = str(cap)
-            assert isinstance(cap_str, str)
-            assert ModelCapability.from_string(cap_str) == cap
+    @pytest.mark.parametrize("cap", list(ModelCapability), ids=str)
+    def test_string_round_trip(self, cap: ModelCapability) -> None:
+        """Test __str__ returns the value and from_string converts it back."""
+        assert str(cap) == cap.value
+        assert ModelCapability.from_string(str(cap)) is cap
 
 
 class TestCapabilityValidatorErrorHandling:
     """Test error handling in CapabilityValidator."""
 
-    @patch("pathlib.Path.exists")
-    def test_missing_definitions_directory(self, mock_exists: Any) -> None:
-        """Test graceful handling when definitions directory doesn't exist."""
-        mock_exists.return_value = False
+    @pytest.fixture(autouse=True)
+    def _discard_mocked_capabilities(self) -> Iterator[None]:
+        """Drop whatever a mocked load cached so later tests see real data."""
+        yield
+        CapabilityValidator.clear_cache()
 
+    @pytest.fixture
+    def definitions_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point the validator at an empty temporary definitions directory."""
+        monkeypatch.setattr(CapabilityValidator, "_definitions_dir", tmp_path)
         CapabilityValidator.clear_cache()
+        return tmp_path
+
+    def test_missing_definitions_directory(self, definitions_dir: Path) -> None:
+        """Test graceful handling when definitions directory doesn't exist."""
+        definitions_dir.rmdir()
+
         CapabilityValidator._load_capabilities()
 
-        # Should not crash, just return early with loaded=True but empty cache
-        # Since the directory doesn't exist, it returns early after setting _loaded
+        # Should not crash, just return early with an empty cache
         caps = CapabilityValidator.get_capabilities("nonexistent-model")
         assert caps == set()
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.rglob")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_invalid_yaml_data_skipped(
-        self, mock_file: Any, mock_rglob: Any, mock_exists: Any
-    ) -> None:
+    def test_invalid_yaml_data_skipped(self, definitions_dir: Path) -> None:
         """Test that YAML files without model_id are skipped."""
-        mock_exists.return_value = True
-
-        mock_yaml_path = Mock(spec=Path)
-        mock_yaml_path.__str__ = Mock(return_value="test.yaml")  # type: ignore[method-assign]
-        mock_rglob.return_value = [mock_yaml_path]
-
-        # Mock YAML content without model_id
-        with patch("yaml.safe_load", return_value={"name": "Test"}):
-            CapabilityValidator.clear_cache()
-            CapabilityValidator._load_capabilities()
-
-            # Should have loaded but skipped this file
-            assert CapabilityValidator._loaded is True
-
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.rglob")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("builtins.print")
-    def test_invalid_capability_in_yaml_generates_warning(  # type: ignore[no-untyped-def]
-        self, mock_print, mock_file, mock_rglob, mock_exists
-    ) -> None:
-        """Test that invalid capabilities in YAML generate warnings."""
-        mock_exists.return_value = True
+        (definitions_dir / "test.yaml").write_text("name: Test\n")
 
-        mock_yaml_path = Mock(spec=Path)
-        mock_yaml_path.__str__ = Mock(return_value="test.yaml")  # type: ignore[method-assign]
-        mock_rglob.return_value = [mock_yaml_path]
+        CapabilityValidator._load_capabilities()
+
+        # Should have loaded but skipped this file
+        assert CapabilityValidator._loaded is True
+        assert CapabilityValidator._capabilities_cache == {}
 
-        # YAML with invalid capability
-        yaml_content = """
+    def test_invalid_capability_in_yaml_generates_warning(
+        self, definitions_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that invalid capabilities in YAML generate warnings."""
+        (definitions_dir / "test.yaml").write_text("""
 model_id: test-model
 capabilities:
   - vision
   - invalid_capability
   - function_calling
-"""
+""")
 
-        with patch("yaml.safe_load", return_value=yaml.safe_load(yaml_content)):
-            CapabilityValidator.clear_cache()
-            CapabilityValidator._load_capabilities()
+        CapabilityValidator._load_capabilities()
 
-            # Should have printed warning about invalid capability
-            mock_print.assert_called()
-            call_args = str(mock_print.call_args_list)
-            assert "Warning" in call_args
+        # Should have printed warning about invalid capability
+        out = capsys.readouterr().out
+        assert "Warning" in out
+        assert "invalid_capability" in out
 
-            # Should have loaded the valid capabilities
-            caps = CapabilityValidator.get_capabilities("test-model")
-            assert ModelCapability.VISION in caps
-            assert ModelCapability.FUNCTION_CALLING in caps
+        # Should have loaded the valid capabilities
+        caps = CapabilityValidator.get_capabilities("test-model")
+        assert caps == {ModelCapability.VISION, ModelCapability.FUNCTION_CALLING}
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.rglob")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("builtins.print")
     def test_yaml_load_exception_handling(
-        self, mock_print: Any, mock_file: Any, mock_rglob: Any, mock_exists: Any
+        self, definitions_dir: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """Test exception handling when YAML loading fails."""
-        mock_exists.return_value = True
-
-        mock_yaml_path = Mock(spec=Path)
-        mock_yaml_path.__str__ = Mock(return_value="bad.yaml")  # type: ignore[method-assign]
-        mock_rglob.return_value = [mock_yaml_path]
+        (definitions_dir / "bad.yaml").write_text("model_id: [unclosed\n")
 
-        # Simulate YAML parsing error
-        with patch("yaml.safe_load", side_effect=yaml.YAMLError("Parse error")):
-            CapabilityValidator.clear_cache()
-            CapabilityValidator._load_capabilities()
+        CapabilityValidator._load_capabilities()
 
-            # Verify error was caught and warning printed
-            mock_print.assert_called()
-            call_args = str(mock_print.call_args_list[-1])
-            assert "Warning" in call_args or "Failed" in call_args
+        # Verify error was caught and warning printed
+        out = capsys.readouterr().out
+        assert "Failed to load capabilities" in out
+        assert "bad.yaml" in out
+        assert CapabilityValidator._loaded is True
 
 
+@pytest.mark.usefixtures("loaded_caps")
 class TestHasAllCapabilities:
     """Test has_all_capabilities method."""
 
     def test_has_all_capabilities_returns_true_when_all_present(self) -> None:
         """Test returns True when model has all required capabilities."""
-        # Clear cache from mock tests
-        CapabilityValidator.clear_cache()
-
         # Claude Sonnet has vision, function_calling, and more
         result = CapabilityValidator.has_all_capabilities(
             "claude-sonnet-4-5", [ModelCapability.VISION, ModelCapability.FUNCTION_CALLING]
@@ -200,14 +163,12 @@ class TestHasAllCapabilities:
         assert result is False
 
 
+@pytest.mark.usefixtures("loaded_caps")
 class TestHasAnyCapability:
     """Test has_any_capability method."""
 
     def test_has_any_capability_returns_true_when_at_least_one_present(self) -> None:
         """Test returns True when model has at least one capability."""
-        # Clear cache from mock tests
-        CapabilityValidator.clear_cache()
-
         # Flash-Lite has VISION but not all advanced features
         result = CapabilityValidator.has_any_capability(
             "gemini-2-5-flash-lite",
@@ -241,14 +202,12 @@ class TestHasAnyCapability:
         assert result is False
 
 
+@pytest.mark.usefixtures("loaded_caps")
 class TestFilterModelsByCapability:
     """Test filter_models_by_capability method."""
 
     def test_filter_models_by_capability_returns_matching_models(self) -> None:
         """Test filtering returns all models with the capability."""
-        # Clear cache from mock tests
-        CapabilityValidator.clear_cache()
-
         vision_models = CapabilityValidator.filter_models_by_capability(ModelCapability.VISION)
 
         assert isinstance(vision_models, list)
@@ -259,9 +218,6 @@ class TestFilterModelsByCapability:
 
     def test_filter_models_by_capability_with_rare_capability(self) -> None:
         """Test filtering with capability few models have."""
-        # Clear cache from mock tests
-        CapabilityValidator.clear_cache()
-
         code_exec_models = CapabilityValidator.filter_models_by_capability(
             ModelCapability.CODE_EXECUTION
         )
@@ -278,14 +234,12 @@ class TestFilterModelsByCapability:
         assert isinstance(models, list)
 
 
+@pytest.mark.usefixtures("loaded_caps")
 class TestGetCapabilityMatrix:
     """Test get_capability_matrix method."""
 
     def test_get_capability_matrix_returns_complete_mapping(self) -> None:
         """Test matrix returns all models with their capabilities."""
-        # Clear cache from mock tests
-        CapabilityValidator.clear_cache()
-
         matrix = CapabilityValidator.get_capability_matrix()
 
         assert isinstance(matrix, dict)
@@ -332,22 +286,18 @@ class TestGetCapabilityMatrix:
             assert cap_strings == caps_strings_from_enum
 
 
+@pytest.mark.usefixtures("loaded_caps")
 class TestConvenienceFunctions:
     """Test module-level convenience functions."""
 
     def test_has_vision_convenience_function(self) -> None:
         """Test has_vision convenience function."""
-        # Clear cache to ensure fresh data
-        CapabilityValidator.clear_cache()
-
         assert has_vision("claude-sonnet-4-5") is True
         assert has_vision("gpt-4o") is True
         assert has_vision("nonexistent-model") is False
 
     def test_has_function_calling_convenience_function(self) -> None:
         """Test has_function_calling convenience function."""
-        CapabilityValidator.clear_cache()
-
         assert has_function_calling("claude-opus-4-1") is True
         assert has_function_calling("gpt-4o-mini") is True
         # Flash-Lite doesn't have function calling
@@ -355,8 +305,6 @@ class TestConvenienceFunctions:
 
     def test_has_prompt_caching_convenience_function(self) -> None:
         """Test has_prompt_caching convenience function."""
-        CapabilityValidator.clear_cache()
-
         assert has_prompt_caching("claude-sonnet-4-5") is True
         assert has_prompt_caching("gemini-2-5-flash") is True
         # Flash-Lite and GPT models don't have prompt caching
@@ -365,8 +313,6 @@ class TestConvenienceFunctions:
 
     def test_supports_large_context_convenience_function(self) -> None:
         """Test supports_large_context convenience function."""
-        CapabilityValidator.clear_cache()
-
         # All current models have large context (>32k)
         assert supports_large_context("claude-haiku-4-5") is True
         assert supports_large_context("gpt-4o") is True
@@ -419,3 +365,12 @@ class TestCacheClear:
         caps = CapabilityValidator.get_capabilities("claude-haiku-4-5")
         assert len(caps) > 0
         assert CapabilityValidator._loaded is True
+
+    def test_clear_cache_resets_lookup_memo(self) -> None:
+        """Test that clear_cache also drops memoized per-model lookups."""
+        _ = CapabilityValidator.get_capabilities("claude-sonnet-4-5")
+        assert CapabilityValidator._lookup.cache_info().currsize > 0
+
+        CapabilityValidator.clear_cache()
+
+        assert CapabilityValidator._lookup.cache_info().currsize == 0
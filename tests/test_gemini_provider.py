@@ -195,7 +195,7 @@ class TestCostCalculation:
 
         # Flash: $0.075 input, $0.30 output per 1M tokens
         expected = (100_000 / 1_000_000) * 0.075 + (10_000 / 1_000_000) * 0.30
-        assert abs(cost - expected) < 0.0001
+        assert cost == pytest.approx(expected, abs=0.0001)
 
     @patch("pm_prompt_toolkit.providers.gemini.genai")
     @patch("pm_prompt_toolkit.providers.gemini.get_settings")
@@ -209,7 +209,7 @@ class TestCostCalculation:
 
         # Pro: $1.25 input, $5.00 output per 1M tokens
         expected = (100_000 / 1_000_000) * 1.25 + (10_000 / 1_000_000) * 5.00
-        assert abs(cost - expected) < 0.0001
+        assert cost == pytest.approx(expected, abs=0.0001)
 
     @patch("pm_prompt_toolkit.providers.gemini.genai")
     @patch("pm_prompt_toolkit.providers.gemini.get_settings")
@@ -231,7 +231,7 @@ class TestCostCalculation:
             + (50_000 / 1_000_000) * 0.019  # Cached input
             + (10_000 / 1_000_000) * 0.30  # Output
         )
-        assert abs(cost - expected) < 0.0001
+        assert cost == pytest.approx(expected, abs=0.0001)
 
     @patch("pm_prompt_toolkit.providers.gemini.genai")
     @patch("pm_prompt_toolkit.providers.gemini.get_settings")
@@ -248,7 +248,7 @@ class TestCostCalculation:
         # Pro: $1.25 input, $5.00 output, $0.31 cache read per 1M tokens
         # All input is cached
         expected = (100_000 / 1_000_000) * 0.31 + (10_000 / 1_000_000) * 5.00
-        assert abs(cost - expected) < 0.0001
+        assert cost == pytest.approx(expected, abs=0.0001)
 
 
 class TestClassifyImplementation:
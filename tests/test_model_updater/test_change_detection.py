@@ -295,3 +295,8 @@ def test_total_changes_count(
     # Should count new model + pricing change
     assert report.total_changes >= 2
     assert report.has_changes
+
+    counts = report.counts
+    assert counts.new == 1
+    assert counts.pricing == len(report.pricing_changes)
+    assert counts.total == report.total_changes
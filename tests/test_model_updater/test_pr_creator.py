@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""Tests for GitHub PR creation."""
+
+import json
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scripts.model_updater.change_detector import ChangeReport
+from scripts.model_updater.pr_creator import PRCreator
+
+
+class FakeResponse:
+    """Minimal stand-in for http.client.HTTPResponse."""
+
+    def __init__(self, status: int, payload: Any) -> None:
+        self.status = status
+        self._data = json.dumps(payload).encode("utf-8")
+
+    def read(self) -> bytes:
+        return self._data
+
+
+@pytest.fixture
+def api_creator(monkeypatch: pytest.MonkeyPatch) -> PRCreator:
+    """PRCreator configured to use the GitHub API."""
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+    return PRCreator()
+
+
+def test_api_calls_share_one_connection(api_creator: PRCreator) -> None:
+    """Test PR creation, auto-merge and issue creation reuse one HTTPS connection."""
+    connection = Mock()
+    connection.getresponse.side_effect = [
+        FakeResponse(200, {"default_branch": "main"}),
+        FakeResponse(201, {"html_url": "https://github.com/owner/repo/pull/7", "node_id": "PR_7"}),
+        FakeResponse(200, {"data": {}}),
+        FakeResponse(201, {"html_url": "https://github.com/owner/repo/issues/8"}),
+    ]
+
+    connect = patch("http.client.HTTPSConnection", return_value=connection)
+    with connect as conn_cls, patch("subprocess.run") as run:
+        pr_url = api_creator._create_github_pr("auto-update", ChangeReport())
+        assert api_creator.enable_auto_merge(pr_url)
+        issue_url = api_creator.create_deprecation_issue(["old-model"])
+
+    assert pr_url == "https://github.com/owner/repo/pull/7"
+    assert issue_url == "https://github.com/owner/repo/issues/8"
+    conn_cls.assert_called_once()
+    run.assert_not_called()
+
+    paths = [c.args[1] for c in connection.request.call_args_list]
+    assert paths == [
+        "/repos/owner/repo",
+        "/repos/owner/repo/pulls",
+        "/graphql",
+        "/repos/owner/repo/issues",
+    ]
+    merge_payload = json.loads(connection.request.call_args_list[2].kwargs["body"])
+    assert merge_payload["variables"] == {"id": "PR_7"}
+
+
+def test_api_error_status_raises(api_creator: PRCreator) -> None:
+    """Test GitHub error responses surface as failures."""
+    connection = Mock()
+    connection.getresponse.return_value = FakeResponse(422, {"message": "Validation Failed"})
+
+    with patch("http.client.HTTPSConnection", return_value=connection):
+        assert api_creator.create_deprecation_issue(["old-model"]) is None
+
+
+def test_uses_gh_auth_token_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test gh's stored token is fetched once and then reused for API calls."""
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+    creator = PRCreator()
+
+    connection = Mock()
+    connection.getresponse.side_effect = [
+        FakeResponse(201, {"html_url": "https://github.com/owner/repo/issues/1"}),
+        FakeResponse(201, {"html_url": "https://github.com/owner/repo/issues/2"}),
+    ]
+    gh_token = patch("subprocess.run", return_value=Mock(returncode=0, stdout=b"gho_x\n"))
+    with patch("http.client.HTTPSConnection", return_value=connection), gh_token as run:
+        creator.create_deprecation_issue(["a"])
+        creator.create_deprecation_issue(["b"])
+
+    run.assert_called_once()
+    assert run.call_args.args[0][1:] == ["auth", "token"]
+    headers = connection.request.call_args.kwargs["headers"]
+    assert headers["Authorization"] == "Bearer gho_x"
+
+
+def test_falls_back_to_gh_without_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the gh CLI is used when no GitHub token is configured."""
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    creator = PRCreator()
+
+    no_auth = Mock(returncode=1, stdout=b"")
+    gh_result = Mock(stdout=b"https://github.com/o/r/issues/1\n")
+    run = patch("subprocess.run", side_effect=[no_auth, gh_result])
+    with patch("http.client.HTTPSConnection") as conn_cls, run:
+        issue_url = creator.create_deprecation_issue(["old-model"])
+
+    assert issue_url == "https://github.com/o/r/issues/1"
+    conn_cls.assert_not_called()
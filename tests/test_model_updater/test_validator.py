@@ -3,6 +3,7 @@
 
 """Tests for model validator."""
 
+import logging
 from datetime import date
 
 import pytest
@@ -68,6 +69,28 @@ def test_validate_missing_required_fields(validator: ModelValidator) -> None:
     assert "name is required" in result.errors
 
 
+def test_validate_fail_fast_skips_checks_after_missing_fields(validator: ModelValidator) -> None:
+    """Test fail_fast reports only the missing required fields."""
+    model = ModelData(
+        model_id="broken",
+        provider="test",
+        name="Broken",
+        api_identifier="",  # Missing
+        context_window_input=-1,
+        context_window_output=None,
+        knowledge_cutoff="",
+        release_date=date(2025, 1, 1),
+        docs_url="https://example.com",
+    )
+
+    full = validator.validate(model)
+    fast = validator.validate(model, fail_fast=True)
+
+    assert not fast.is_valid
+    assert fast.errors == ["api_identifier is required"]
+    assert len(full.errors) > len(fast.errors)
+
+
 def test_validate_invalid_context_window(validator: ModelValidator, valid_model: ModelData) -> None:
     """Test validation fails for invalid context window."""
     valid_model.context_window_input = -100
@@ -118,6 +141,19 @@ def test_validate_invalid_tier(validator: ModelValidator, valid_model: ModelData
     assert any("Invalid cost_tier" in e for e in result.errors)
 
 
+def test_invalid_tier_message_lists_sorted_values(
+    validator: ModelValidator, valid_model: ModelData
+) -> None:
+    """Test tier errors list the allowed values in a stable, readable order."""
+    valid_model.cost_tier = "cheap"
+    valid_model.speed_tier = "slow"
+
+    result = validator.validate(valid_model)
+
+    assert "Invalid cost_tier 'cheap', must be one of budget, mid-tier, premium" in result.errors
+    assert "Invalid speed_tier 'slow', must be one of balanced, fast, thorough" in result.errors
+
+
 def test_validate_suspiciously_high_price(
     validator: ModelValidator, valid_model: ModelData
 ) -> None:
@@ -208,3 +244,92 @@ def test_validate_cache_pricing(validator: ModelValidator, valid_model: ModelDat
     # Should have warning if cache_write < input_per_1m
     if valid_model.cache_write_per_1m < valid_model.input_per_1m:
         assert any("cache_write" in w for w in result.warnings)
+
+
+def test_validate_batch_releases_date_cache(
+    validator: ModelValidator, valid_model: ModelData
+) -> None:
+    """Test batch validation pins today's date only for the batch's duration."""
+    valid_model.release_date = date(date.today().year + 5, 1, 1)
+
+    results = validator.validate_batch([valid_model])
+
+    assert any("years in the future" in w for w in results["test-model"].warnings)
+    assert validator._today_cache is None
+    assert validator._max_future_date_cache is None
+
+
+def test_validation_summary_reflects_later_changes(
+    validator: ModelValidator, valid_model: ModelData
+) -> None:
+    """Test summaries are computed from the results passed in, not a cached batch."""
+    results = validator.validate_batch([valid_model, valid_model])
+    summary = validator.get_validation_summary(results)
+    assert summary["total_models"] == 1
+    assert summary["valid"] == 1
+
+    results["test-model"].is_valid = False
+    results["test-model"].errors.append("changed after the batch")
+    summary = validator.get_validation_summary(results)
+
+    assert summary["valid"] == 0
+    assert summary["total_errors"] == 1
+
+
+def test_validate_batch_with_summary_counts_in_one_pass(
+    validator: ModelValidator, valid_model: ModelData
+) -> None:
+    """Test the batch summary matches a recomputed one, with repeated IDs replaced."""
+    replacement = ModelData(
+        model_id="test-model",
+        provider="",  # Invalid
+        name="Test Model",
+        api_identifier="test-model-v1",
+        context_window_input=128000,
+        context_window_output=None,
+        knowledge_cutoff="January 2025",
+        release_date=date(2025, 1, 1),
+        docs_url="https://example.com/docs",
+    )
+
+    results, summary = validator.validate_batch_with_summary([valid_model, replacement])
+
+    assert not results["test-model"].is_valid
+    assert summary == validator.get_validation_summary(results)
+    assert summary["total_models"] == 1
+    assert summary["valid"] == 0
+
+
+def test_validate_batch_logs_failures_once(
+    validator: ModelValidator, valid_model: ModelData, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test batch validation emits a single failure line instead of one per model."""
+    broken = ModelData(
+        model_id="broken",
+        provider="",
+        name="Broken",
+        api_identifier="broken",
+        context_window_input=128000,
+        context_window_output=None,
+        knowledge_cutoff="",
+        release_date=date(2025, 1, 1),
+        docs_url="https://example.com",
+    )
+
+    with caplog.at_level(logging.ERROR):
+        validator.validate_batch([valid_model, broken])
+
+    failures = [r for r in caplog.records if r.levelno == logging.ERROR]
+    assert len(failures) == 1
+    assert "broken" in failures[0].getMessage()
+
+
+def test_validate_negative_cache_pricing(validator: ModelValidator, valid_model: ModelData) -> None:
+    """Test negative cache pricing is an error without a relative-price warning."""
+    valid_model.cache_read_per_1m = -0.1
+
+    result = validator.validate(valid_model)
+
+    assert not result.is_valid
+    assert "cache_read_per_1m must be non-negative, got -0.1" in result.errors
+    assert not any("cache_read" in w for w in result.warnings)
@@ -199,7 +199,7 @@ class TestCostCalculation:
 
         # GPT-4o: $2.50 input, $10.00 output per 1M tokens
         expected = (100_000 / 1_000_000) * 2.50 + (10_000 / 1_000_000) * 10.00
-        assert abs(cost - expected) < 0.0001
+        assert cost == pytest.approx(expected, abs=0.0001)
 
     @patch("pm_prompt_toolkit.providers.openai.OpenAI")
     @patch("pm_prompt_toolkit.providers.openai.get_settings")
@@ -213,7 +213,7 @@ class TestCostCalculation:
 
         # GPT-4o-mini: $0.15 input, $0.60 output per 1M tokens
         expected = (100_000 / 1_000_000) * 0.15 + (10_000 / 1_000_000) * 0.60
-        assert abs(cost - expected) < 0.0001
+        assert cost == pytest.approx(expected, abs=0.0001)
 
     @patch("pm_prompt_toolkit.providers.openai.OpenAI")
     @patch("pm_prompt_toolkit.providers.openai.get_settings")
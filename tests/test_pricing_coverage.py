@@ -152,7 +152,7 @@ class TestPricingServiceErrorHandling:
         mock_rglob.return_value = [yaml_path]
 
         # YAML without model_id
-        with patch("yaml.safe_load", return_value={"name": "Test"}):
+        with patch("ai_models.pricing.load_definition", return_value={"name": "Test"}):
             service = PricingService()
 
             # Should skip this file
@@ -174,7 +174,7 @@ class TestPricingServiceErrorHandling:
         mock_rglob.return_value = [yaml_path]
 
         # Simulate YAML error
-        with patch("yaml.safe_load", side_effect=yaml.YAMLError("Parse error")):
+        with patch("ai_models.pricing.load_definition", side_effect=yaml.YAMLError("Parse error")):
             PricingService()
 
             # Should print warning
@@ -175,7 +175,8 @@ class TestErrorHandling:
         # Mock YAML content without model_id
         mock_file.return_value.read.return_value = "name: Test"
 
-        with patch("yaml.safe_load", return_value={"name": "Test"}):  # No model_id
+        # No model_id
+        with patch("ai_models.registry.load_definition", return_value={"name": "Test"}):
             ModelRegistry.clear_cache()
             ModelRegistry._load_models()
 
@@ -197,7 +198,7 @@ class TestErrorHandling:
         mock_rglob.return_value = [mock_yaml_path]
 
         # Simulate YAML parsing error
-        with patch("yaml.safe_load", side_effect=yaml.YAMLError("Parse error")):
+        with patch("ai_models.registry.load_definition", side_effect=yaml.YAMLError("Parse error")):
             ModelRegistry.clear_cache()
             ModelRegistry._load_models()
 
@@ -237,7 +238,7 @@ pricing:
   output_per_1m: 2.0
 """
 
-        with patch("yaml.safe_load", return_value=yaml.safe_load(yaml_content)):
+        with patch("ai_models.registry.load_definition", return_value=yaml.safe_load(yaml_content)):
             ModelRegistry.clear_cache()
             ModelRegistry._load_models()
 
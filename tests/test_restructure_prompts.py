@@ -0,0 +1,27 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""Regression tests for the v1 prompt restructuring script."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from scripts.restructure_prompts import restructure_prompt_directory
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "restructure_prompts"
+OUTPUT_FILES = ("prompt.md", "prompt.claude.md", "prompt.openai.md", "prompt.gemini.md")
+
+
+@pytest.mark.parametrize("case", sorted(p.name for p in FIXTURES_DIR.iterdir() if p.is_dir()))
+def test_legacy_prompt_output_matches_expected(case: str, tmp_path: Path) -> None:
+    """Test restructuring a legacy-format prompt.md reproduces the recorded output."""
+    fixture = FIXTURES_DIR / case
+    shutil.copy(fixture / "prompt.md", tmp_path / "prompt.md")
+
+    restructure_prompt_directory(tmp_path)
+
+    for name in OUTPUT_FILES:
+        expected = (fixture / "expected" / name).read_text(encoding="utf-8")
+        assert (tmp_path / name).read_text(encoding="utf-8") == expected, name
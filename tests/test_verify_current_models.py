@@ -0,0 +1,342 @@
+# Copyright (c) 2025 Andy Woods
+# Licensed under the MIT License (see LICENSE file)
+
+"""Tests for the model endpoint verification script."""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+from google.rpc.error_details_pb2 import ErrorInfo
+from tenacity import wait_none
+
+from scripts.verify_current_models import ModelVerifier, RateLimiter, VerifyResult
+
+
+@pytest.fixture
+def verifier(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ModelVerifier:
+    """Verifier pointed at a small set of model definitions, with API keys configured."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    for provider, model_ids in {
+        "anthropic": ["claude-a", "claude-b"],
+        "openai": ["gpt-a", "gpt-b", "gpt-c"],
+    }.items():
+        provider_dir = tmp_path / provider
+        provider_dir.mkdir()
+        for model_id in model_ids:
+            (provider_dir / f"{model_id}.yaml").write_text(
+                f"model_id: {model_id}\napi_identifier: {model_id}-v1\n"
+            )
+
+    model_verifier = ModelVerifier(cache_dir=tmp_path / "cache")
+    model_verifier.definitions_dir = tmp_path
+    return model_verifier
+
+
+def test_models_are_verified_concurrently(
+    verifier: ModelVerifier, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test verification calls overlap instead of running one after another."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_verify(provider: str, model_id: str, api_identifier: str) -> VerifyResult:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return VerifyResult(success=True, api_identifier=api_identifier)
+
+    monkeypatch.setattr(verifier, "verify_model", fake_verify)
+    results = asyncio.run(verifier.verify_all_models())
+
+    assert set(results) == {"claude-a", "claude-b", "gpt-a", "gpt-b", "gpt-c"}
+    assert results["gpt-b"].provider == "openai"
+    assert results["gpt-b"].api_identifier == "gpt-b-v1"
+    assert peak == 5
+
+
+def test_provider_filter(verifier: ModelVerifier, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test only the requested provider's models are verified."""
+    calls = []
+
+    async def fake_verify(provider: str, model_id: str, api_identifier: str) -> VerifyResult:
+        calls.append(model_id)
+        return VerifyResult(success=False, error="boom")
+
+    monkeypatch.setattr(verifier, "verify_model", fake_verify)
+    asyncio.run(verifier.verify_all_models(provider_filter="Anthropic"))
+
+    assert sorted(calls) == ["claude-a", "claude-b"]
+    assert not verifier.results["claude-a"].success
+
+
+def test_anthropic_client_shared_across_models(
+    verifier: ModelVerifier, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test one async client serves every Anthropic call and is closed after the run."""
+    client = Mock()
+    client.models.retrieve = AsyncMock(return_value=Mock(id="claude"))
+    client.messages.create = AsyncMock()
+    client.close = AsyncMock()
+
+    with patch("anthropic.AsyncAnthropic", return_value=client) as client_cls:
+        results = asyncio.run(verifier.verify_all_models(provider_filter="anthropic"))
+
+    assert all(result.success for result in results.values())
+    assert all(result.tokens_used == 0 for result in results.values())
+    client_cls.assert_called_once()
+    assert client.models.retrieve.await_count == 2
+    client.messages.create.assert_not_called()
+    client.close.assert_awaited_once()
+
+
+def test_deep_mode_makes_generation_call(verifier: ModelVerifier) -> None:
+    """Test --deep verifies with a minimal generation instead of a model lookup."""
+    client = Mock()
+    client.models.retrieve = AsyncMock()
+    client.chat.completions.create = AsyncMock(
+        return_value=Mock(model="gpt", usage=Mock(total_tokens=12))
+    )
+    client.close = AsyncMock()
+    verifier.deep = True
+
+    with patch("openai.AsyncOpenAI", return_value=client):
+        result = asyncio.run(verifier.verify_model("openai", "gpt-a", "gpt-a-v1"))
+
+    assert result.tokens_used == 12
+    client.models.retrieve.assert_not_called()
+
+
+def test_aliases_share_one_call(verifier: ModelVerifier, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test definitions pointing at the same API identifier trigger a single call."""
+    (verifier.definitions_dir / "openai" / "gpt-alias.yaml").write_text(
+        "model_id: gpt-alias\napi_identifier: gpt-a-v1\n"
+    )
+    calls = []
+
+    async def fake_verify(provider: str, model_id: str, api_identifier: str) -> VerifyResult:
+        calls.append(api_identifier)
+        return VerifyResult(success=True, api_identifier=api_identifier)
+
+    monkeypatch.setattr(verifier, "verify_model", fake_verify)
+    results = asyncio.run(verifier.verify_all_models(provider_filter="openai"))
+
+    assert calls.count("gpt-a-v1") == 1
+    assert results["gpt-alias"].model_id == "gpt-alias"
+    assert results["gpt-a"].model_id == "gpt-a"
+
+    # A second run reuses the successful results
+    asyncio.run(verifier.verify_all_models(provider_filter="openai"))
+    assert len(calls) == 3
+
+
+def test_disk_cache_reused_across_runs(
+    verifier: ModelVerifier, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test successful results persist between verifiers until the TTL expires."""
+    calls = []
+
+    async def fake_verify(provider: str, model_id: str, api_identifier: str) -> VerifyResult:
+        calls.append(model_id)
+        return VerifyResult(success=model_id != "claude-b", api_identifier=api_identifier)
+
+    monkeypatch.setattr(verifier, "verify_model", fake_verify)
+    asyncio.run(verifier.verify_all_models(provider_filter="anthropic"))
+    assert sorted(calls) == ["claude-a", "claude-b"]
+
+    fresh = ModelVerifier(cache_dir=tmp_path / "cache")
+    fresh.definitions_dir = verifier.definitions_dir
+    monkeypatch.setattr(fresh, "verify_model", fake_verify)
+    results = asyncio.run(fresh.verify_all_models(provider_filter="anthropic"))
+
+    # Only the failure is retried
+    assert sorted(calls) == ["claude-a", "claude-b", "claude-b"]
+    assert results["claude-a"].cache_hit
+
+    expired = ModelVerifier(cache_dir=tmp_path / "cache", cache_ttl_hours=0)
+    expired.definitions_dir = verifier.definitions_dir
+    monkeypatch.setattr(expired, "verify_model", fake_verify)
+    asyncio.run(expired.verify_all_models(provider_filter="anthropic"))
+    assert calls.count("claude-a") == 2
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "[]",
+        '{"KEY": []}',
+        '{"KEY": {"timestamp": "soon", "result": {}}}',
+        '{"KEY": {"timestamp": 1e18, "result": {"bogus": 1}}}',
+    ],
+    ids=["not-a-dict", "entry-not-a-dict", "bad-timestamp", "bad-result"],
+)
+def test_malformed_disk_cache_treated_as_miss(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, contents: str
+) -> None:
+    """Test a corrupt cache file or entry is discarded instead of breaking the run."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    (tmp_path / "anthropic").mkdir()
+    (tmp_path / "anthropic" / "claude-a.yaml").write_text("model_id: claude-a\n")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    probe = ModelVerifier(cache_dir=cache_dir)
+    key = probe._cache_key("anthropic", "claude-a")
+    (cache_dir / "results.json").write_text(contents.replace("KEY", key))
+
+    verifier = ModelVerifier(cache_dir=cache_dir)
+    verifier.definitions_dir = tmp_path
+
+    async def fake_verify(provider: str, model_id: str, api_identifier: str) -> VerifyResult:
+        return VerifyResult(success=False, api_identifier=api_identifier, error="boom")
+
+    monkeypatch.setattr(verifier, "verify_model", fake_verify)
+    results = asyncio.run(verifier.verify_all_models())
+
+    assert results["claude-a"].error == "boom"
+    assert verifier.counts["failed"] == 1
+    assert key not in verifier._disk_cache
+
+
+def test_rate_limiter_paces_calls() -> None:
+    """Test the token bucket allows a burst and then spaces out later calls."""
+
+    async def acquire_all() -> float:
+        limiter = RateLimiter(rate=2, period=0.1)
+        start = time.monotonic()
+        for _ in range(4):
+            async with limiter:
+                pass
+        return time.monotonic() - start
+
+    assert asyncio.run(acquire_all()) >= 0.09
+
+
+def test_rate_limited_call_is_retried(
+    verifier: ModelVerifier, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test rate-limit errors are retried with backoff until the call succeeds."""
+    monkeypatch.setattr("scripts.verify_current_models.RATE_LIMIT_WAIT", wait_none())
+    attempts = []
+
+    async def request() -> str:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TimeoutError("rate limited")
+        return "ok"
+
+    assert asyncio.run(verifier._call("openai", request, TimeoutError)) == "ok"
+    assert len(attempts) == 3
+
+
+def test_unavailable_provider_skipped_without_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test models of a provider without an API key are skipped before any file is read."""
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    google_dir = tmp_path / "google"
+    google_dir.mkdir()
+    (google_dir / "gemini-x.yaml").write_text("model_id: gemini-x\n")
+
+    model_verifier = ModelVerifier(cache_dir=None)
+    model_verifier.definitions_dir = tmp_path
+    with patch("scripts.verify_current_models._load_definition") as load:
+        results = asyncio.run(model_verifier.verify_all_models())
+
+    load.assert_not_called()
+    assert results["gemini-x"].skip_reason == "missing_api_key"
+    assert results["gemini-x"].error == "GOOGLE_API_KEY not set"
+
+
+def test_counts_tallied_as_results_recorded(
+    verifier: ModelVerifier, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test outcome counts are kept as results arrive, and quiet mode prints nothing."""
+
+    async def fake_verify(provider: str, model_id: str, api_identifier: str) -> VerifyResult:
+        return VerifyResult(success=provider == "anthropic", error="boom")
+
+    verifier.quiet = True
+    monkeypatch.setattr(verifier, "verify_model", fake_verify)
+    asyncio.run(verifier.verify_all_models())
+
+    assert verifier.counts == {"passed": 2, "failed": 3, "skipped": 0}
+    assert capsys.readouterr().out == ""
+
+
+def test_fail_fast_cancels_outstanding_calls(
+    verifier: ModelVerifier, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the first failure stops the run without waiting for slower calls."""
+    cancelled = []
+
+    async def fake_verify(provider: str, model_id: str, api_identifier: str) -> VerifyResult:
+        if model_id == "gpt-b":
+            return VerifyResult(success=False, error="Model not found")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(model_id)
+            raise
+        return VerifyResult(success=True)
+
+    monkeypatch.setattr(verifier, "verify_model", fake_verify)
+    start = time.monotonic()
+    results = asyncio.run(verifier.verify_all_models(fail_fast=True))
+
+    assert time.monotonic() - start < 5
+    assert list(results) == ["gpt-b"]
+    assert len(cancelled) == 4
+
+
+def test_provider_errors_normalized(verifier: ModelVerifier) -> None:
+    """Test unknown providers and unexpected SDK errors become failure results."""
+    client = Mock()
+    client.models.retrieve = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with patch("openai.AsyncOpenAI", return_value=client):
+        result = asyncio.run(verifier.verify_model("OpenAI", "gpt-a", "gpt-a-v1"))
+    unknown = asyncio.run(verifier.verify_model("mistral", "m", "m-v1"))
+
+    assert result == VerifyResult(success=False, error="RuntimeError: boom")
+    assert unknown == VerifyResult(success=False, error="Unknown provider: mistral")
+
+
+def test_google_errors_classified_by_type(verifier: ModelVerifier) -> None:
+    """Test Google API exceptions map to not-found and authentication failures."""
+    genai = Mock()
+    verifier._sdks["google"] = genai
+    verifier._api_keys["google"] = "test-key"
+    invalid_key = google_exceptions.InvalidArgument(
+        "API key not valid", error_info=ErrorInfo(reason="API_KEY_INVALID")
+    )
+
+    genai.get_model.side_effect = google_exceptions.NotFound("no such model")
+    missing = asyncio.run(verifier.verify_model("google", "gemini-x", "gemini-x-v1"))
+    genai.get_model.side_effect = invalid_key
+    rejected = asyncio.run(verifier.verify_model("google", "gemini-x", "gemini-x-v1"))
+
+    assert missing.error == "Model not found: gemini-x-v1"
+    assert rejected.skip_reason == "auth_error"
+
+
+def test_summary_lists_failures_and_groups_skips(
+    verifier: ModelVerifier, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test the summary reports failed models and skipped models by reason."""
+    verifier.quiet = True
+    verifier._record("openai", "gpt-a", "gpt-a-v1", VerifyResult(success=True))
+    verifier._record("openai", "gpt-b", "gpt-b-v1", VerifyResult(success=False, error="boom"))
+    skip = VerifyResult(success=False, error="no key", skip_reason="missing_api_key")
+    verifier._record("google", "gemini-x", None, skip)
+    verifier.print_summary()
+
+    out = capsys.readouterr().out
+    assert "• gpt-b (openai)\n    Error: boom" in out
+    assert "missing_api_key:\n    • gemini-x (google)" in out
+    assert "gpt-a (openai)" not in out